@@ -3,32 +3,179 @@ Legal Contract Assistant for Indian SMEs
 Main Streamlit Application
 """
 import streamlit as st
-import os
+import importlib.util
+import shutil
 import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from itertools import islice
 import logging
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Import our modules
-from src.document_processor import DocumentProcessor
-from src.nlp_pipeline import LegalNLPPipeline
-from src.risk_engine import ContractRiskEngine
-from src.llm_explainer import LegalExplainer
-from src.contract_templates import ContractTemplateManager
-
-# Try to import audit logger, but don't fail if it's not available
-try:
-    from src.audit_security import AuditLogger
-    AUDIT_AVAILABLE = True
-except ImportError:
-    AUDIT_AVAILABLE = False
-    logger.warning("Audit logging not available")
-
 from config import *
 
+# Uploads are copied in 1 MB chunks rather than buffered whole; anything up to
+# 2 MB stays in memory, larger files spill to an anonymous temp file
+UPLOAD_COPY_CHUNK_BYTES = 1024 * 1024
+UPLOAD_SPOOL_MAX_BYTES = 2 * 1024 * 1024
+
+# How often the progress steps are refreshed while an analysis stage runs
+PROGRESS_POLL_SECONDS = 0.25
+
+# Analysis results kept per session (oldest evicted first)
+MAX_SESSION_ANALYSES = 8
+
+# Widget values that must survive while their widget is not rendered
+PERSISTED_WIDGET_KEYS = ("page", "risk_filter")
+
+# Analysis components reported on the About page, with the module each lives in
+COMPONENT_MODULES = (
+    ("Document Processing", "src.document_processor"),
+    ("NLP Pipeline", "src.nlp_pipeline"),
+    ("Risk Engine", "src.risk_engine")
+)
+
+# Risk filter options mapped to backend risk levels
+RISK_FILTER_MAP = {
+    "All Risks": "All",
+    "🔴 High Priority": "HIGH",
+    "🟡 Medium Priority": "MEDIUM",
+    "🟢 Low Priority": "LOW"
+}
+
+# Per-level styling: (icon, text color, background color, border color)
+RISK_LEVEL_STYLES = {
+    "HIGH": ("🔴", "#991B1B", "#FEE2E2", "#FECACA"),
+    "MEDIUM": ("🟡", "#92400E", "#FEF3C7", "#FED7AA"),
+    "LOW": ("🟢", "#065F46", "#D1FAE5", "#BBF7D0")
+}
+
+# Clause header badge per risk level: (label, text color, background)
+CLAUSE_RISK_BADGES = {
+    "HIGH": ("🔴 High Risk", "#991B1B", "#FEE2E2"),
+    "MEDIUM": ("🟡 Medium Risk", "#92400E", "#FEF3C7"),
+    "LOW": ("🟢 Low Risk", "#065F46", "#D1FAE5")
+}
+
+RISK_LEVEL_BANNER_HTML = """
+        <div style="background: {bg_color}; padding: 1rem; border-radius: 8px; border: 1px solid {border_color}; margin: 1rem 0;">
+            <h3 style="color: {color}; margin-bottom: 0.5rem;">
+                {icon} {title} Priority Issues ({count} found)
+            </h3>
+        </div>
+        """
+
+TOP_RISK_HTML = """
+            <div class="risk-high">
+                <strong>{number}. {risk_type}</strong><br>
+                <span style="color: var(--neutral-gray);">{sme_concern}</span>
+            </div>
+            """
+
+RISK_VERDICT_HTML = """
+        <div class="{css_class}">
+            <h3>{title}</h3>
+            <p>{body}</p>
+        </div>
+        """
+
+# Overall verdict box on the Recommendations tab: (css class, title, body)
+CONTRACT_VERDICTS = {
+    "HIGH": (
+        "risk-high",
+        "🚨 HIGH RISK CONTRACT - Immediate Action Required",
+        "This contract contains significant risks that could seriously impact your business. <strong>Do not sign without legal review.</strong>"
+    ),
+    "MEDIUM": (
+        "risk-medium",
+        "🟡 MEDIUM RISK CONTRACT - Review Recommended",
+        "This contract has some concerning terms that should be reviewed and potentially negotiated before signing."
+    ),
+    "LOW": (
+        "risk-low",
+        "✅ LOW RISK CONTRACT - Generally Acceptable",
+        "This contract appears to have standard business terms with minimal risk. Still, ensure you understand all obligations."
+    )
+}
+
+BEST_PRACTICE_HTML = """
+        <div style="padding: 1rem 0; border-bottom: 1px solid var(--border-subtle); margin-bottom: 0.5rem;">
+            {title}: {description}
+        </div>
+        """
+
+CLAUSE_HEADER_HTML = """
+    <div style="background: {risk_bg}; padding: 1.5rem; border-radius: 12px; border: 1px solid {risk_color}; margin: 1rem 0;">
+        <h3 style="color: {risk_color}; margin-bottom: 0.5rem;">
+            📄 Clause {number}: {clause_type}
+        </h3>
+        <div style="padding: 0.5rem 1rem; border-radius: 6px; display: inline-block; background: var(--bg-subtle); border: 1px solid var(--border-subtle);">
+            <strong>{risk_badge}</strong>
+        </div>
+    </div>
+    """
+
+CLAUSE_RISK_HTML = """
+                <div style="padding: 1rem 0; border-left: 4px solid {risk_color}; padding-left: 1rem; margin-bottom: 1rem; border-bottom: 1px solid var(--border-subtle);">
+                    <strong>{risk_type}</strong><br>
+                    <span style="color: var(--text-light); font-size: 0.9rem;">Score: {score}/100</span><br>
+                    <span style="font-size: 0.9rem;">{sme_concern}</span>
+                </div>
+                """
+
+EXPLANATION_SECTION_HTML = """
+                        **{title}:**
+                        
+                        <div style="background: #f8fafc; padding: 1rem; border-radius: 8px; border-left: 4px solid var(--secondary-blue); margin-bottom: 1rem;">
+                            {content}
+                        </div>
+                        """
+
+# Card titles for the explanation sections, in display order
+EXPLANATION_SECTION_TITLES = {
+    'simple_explanation': "🎯 What this means in simple terms",
+    'who_benefits': "👥 Who benefits from this clause",
+    'business_impact': "💼 How this affects your business",
+    'watch_out_for': "⚠️ What to watch out for",
+    'assessment': "📊 Is this standard or unusual?"
+}
+
+ACTION_ITEM_HTML = """
+            <div style="padding: 1rem 0; border-left: 4px solid var(--accent-blue); padding-left: 1rem; margin-bottom: 0.5rem; display: flex; justify-content: space-between; align-items: center; border-bottom: 1px solid var(--border-subtle);">
+                <div>
+                    <strong>{priority}:</strong> {action}
+                </div>
+                <div style="color: var(--text-light); font-size: 0.9rem; font-style: italic;">
+                    {timeline}
+                </div>
+            </div>
+            """
+
+SUMMARY_TEXT_TEMPLATE = """
+CONTRACT ANALYSIS SUMMARY
+========================
+
+Contract Type: {contract_type}
+Overall Risk Level: {overall_level} ({overall_score}/100)
+
+Risk Breakdown:
+- High Priority Issues: {high_risk_count}
+- Medium Priority Issues: {medium_risk_count}
+- Low Priority Issues: {low_risk_count}
+
+DISCLAIMER: This analysis is for educational purposes only and does not constitute legal advice.
+Always consult qualified legal professionals for legal matters.
+
+Generated by ContractGuard - {generated_at}
+            """
+
 # Page configuration
 st.set_page_config(
     page_title="ContractGuard - Legal Contract Assistant",
@@ -38,7 +185,8 @@ st.set_page_config(
 )
 
 # Clean, light-themed CSS for professional legal interface - v2.0
-st.markdown("""
+# Base stylesheet (palette, layout, sidebar, widgets) shared by every page
+BASE_CSS = """
 <style>
 /* =========================
    Color Palette (Legal UI)
@@ -240,30 +388,6 @@ section[data-testid="stSidebar"] li {
     border-bottom: 2px solid var(--accent-blue);
 }
 
-/* =========================
-   Risk Boxes
-   ========================= */
-.risk-high {
-    background: var(--error-bg);
-    border-left: 4px solid var(--error-text);
-    padding: 1rem;
-    color: var(--error-text);
-}
-
-.risk-medium {
-    background: var(--warning-bg);
-    border-left: 4px solid var(--warning-text);
-    padding: 1rem;
-    color: var(--warning-text);
-}
-
-.risk-low {
-    background: var(--success-bg);
-    border-left: 4px solid var(--success-text);
-    padding: 1rem;
-    color: var(--success-text);
-}
-
 /* =========================
    Messages
    ========================= */
@@ -293,35 +417,115 @@ footer { visibility: hidden; }
 header { visibility: hidden; }
 </style>
 
-""", unsafe_allow_html=True)
+"""
+
+# Streamlit drops any element that a rerun does not re-emit, so the stylesheet
+# is sent on every run
+st.markdown(BASE_CSS, unsafe_allow_html=True)
+
+# Risk box styles, only emitted by the contract analysis page
+ANALYSIS_CSS = """
+<style>
+/* =========================
+   Risk Boxes
+   ========================= */
+.risk-high {
+    background: var(--error-bg);
+    border-left: 4px solid var(--error-text);
+    padding: 1rem;
+    color: var(--error-text);
+}
+
+.risk-medium {
+    background: var(--warning-bg);
+    border-left: 4px solid var(--warning-text);
+    padding: 1rem;
+    color: var(--warning-text);
+}
+
+.risk-low {
+    background: var(--success-bg);
+    border-left: 4px solid var(--success-text);
+    padding: 1rem;
+    color: var(--success-text);
+}
+</style>
+"""
+
+# Initialize components - each heavy singleton is cached on its own and imports
+# its module on first use, so a page only pays for the components it actually uses
+@st.cache_resource
+def get_doc_processor():
+    """Document processor singleton"""
+    from src.document_processor import DocumentProcessor
+    return DocumentProcessor()
+
+@st.cache_resource
+def get_nlp_pipeline():
+    """NLP pipeline singleton"""
+    from src.nlp_pipeline import LegalNLPPipeline
+    return LegalNLPPipeline()
+
+@st.cache_resource
+def get_risk_engine():
+    """Risk engine singleton"""
+    from src.risk_engine import ContractRiskEngine
+    return ContractRiskEngine()
+
+@st.cache_resource
+def get_explainer():
+    """LLM explainer singleton"""
+    from src.llm_explainer import LegalExplainer
+    return LegalExplainer()
+
+def get_template_manager():
+    """Template manager for this session"""
+    # Kept per session rather than shared: its render cache holds the contract
+    # values a user enters, which must not be served to other sessions. The
+    # templates themselves are built once per process and shared by every manager
+    if "template_manager" not in st.session_state:
+        from src.contract_templates import ContractTemplateManager
+        st.session_state["template_manager"] = ContractTemplateManager()
+    return st.session_state["template_manager"]
 
-# Initialize components
 @st.cache_resource
-def initialize_components():
-    """Initialize all system components"""
+def get_audit_logger():
+    """Audit logger singleton (None when audit logging is disabled or unavailable)"""
+    if not ENABLE_AUDIT_LOGGING:
+        return None
+    
+    # Try to import audit logger, but don't fail if it's not available
     try:
-        doc_processor = DocumentProcessor()
-        nlp_pipeline = LegalNLPPipeline()
-        risk_engine = ContractRiskEngine()
-        explainer = LegalExplainer()
-        template_manager = ContractTemplateManager()
-        audit_logger = AuditLogger() if ENABLE_AUDIT_LOGGING and AUDIT_AVAILABLE else None
-        
-        return doc_processor, nlp_pipeline, risk_engine, explainer, template_manager, audit_logger
+        from src.audit_security import AuditLogger
+    except ImportError:
+        logger.warning("Audit logging not available")
+        return None
+    return AuditLogger()
+
+def load_components(*getters):
+    """Resolve the given component getters, stopping the app if any fails"""
+    try:
+        return tuple(getter() for getter in getters)
     except Exception as e:
         st.error(f"Failed to initialize system components: {str(e)}")
         st.stop()
 
+@contextmanager
+def sidebar_section(icon, title):
+    """Render a styled sidebar section header for the content written inside the block"""
+    # Every st.markdown call is its own element, so a trailing '</div>' call never
+    # wrapped the section body - emit the header in a single call instead
+    st.markdown(f'<div class="sidebar-section"><h3>{icon} {title}</h3></div>', unsafe_allow_html=True)
+    yield
+
 def main():
     """Main application function"""
     
-    # Initialize components
-    doc_processor, nlp_pipeline, risk_engine, explainer, template_manager, audit_logger = initialize_components()
-    
-    # Force page refresh for new styling
-    if 'css_loaded' not in st.session_state:
-        st.session_state.css_loaded = True
-        st.rerun()
+    # Streamlit discards widget state for widgets that are not rendered in a run;
+    # re-assigning the keys keeps e.g. the risk filter across page switches
+    for key in PERSISTED_WIDGET_KEYS:
+        if key in st.session_state:
+            st.session_state[key] = st.session_state[key]
     
     # Clean, professional header
     st.markdown("""
@@ -338,42 +542,37 @@ def main():
     
     # Enhanced sidebar navigation
     with st.sidebar:
-        st.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
-        st.markdown("### 📋 Navigation")
-        
-        page = st.selectbox(
-            "Choose what you'd like to do:",
-            ["📄 Analyze My Contract", "📝 Contract Templates", "📚 Risk Guide", "ℹ️ About ContractGuard"],
-            format_func=lambda x: x,
-            help="Select the feature you want to use"
-        )
-        st.markdown('</div>', unsafe_allow_html=True)
+        with sidebar_section("📋", "Navigation"):
+            page = st.selectbox(
+                "Choose what you'd like to do:",
+                ["📄 Analyze My Contract", "📝 Contract Templates", "📚 Risk Guide", "ℹ️ About ContractGuard"],
+                format_func=lambda x: x,
+                help="Select the feature you want to use",
+                key="page"
+            )
         
         # Quick help section
-        st.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
-        st.markdown("### 🆘 Quick Help")
-        st.markdown("""
-        **Supported Files:**
-        - PDF documents
-        - Word files (.docx)
-        - Text files (.txt)
-        
-        **File Size:** Up to 10MB
-        
-        **Processing Time:** 30-60 seconds
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+        with sidebar_section("🆘", "Quick Help"):
+            st.markdown("""
+            **Supported Files:**
+            - PDF documents
+            - Word files (.docx)
+            - Text files (.txt)
+            
+            **File Size:** Up to 10MB
+            
+            **Processing Time:** 30-60 seconds
+            """)
         
         # Trust indicators
-        st.markdown('<div class="sidebar-section">', unsafe_allow_html=True)
-        st.markdown("### 🔐 Your Privacy")
-        st.markdown("""
-        ✅ Documents processed locally  
-        ✅ No permanent storage  
-        ✅ No data sharing  
-        ✅ Secure analysis  
-        """)
-        st.markdown('</div>', unsafe_allow_html=True)
+        with sidebar_section("🔐", "Your Privacy"):
+            sharing = "⚠️ Clauses sent to AI provider" if PREFETCH_LLM_RESPONSES else "✅ No data sharing"
+            st.markdown(f"""
+            ✅ Documents processed locally  
+            ✅ No permanent storage  
+            {sharing}  
+            ✅ Secure analysis  
+            """)
     
     # Display disclaimers in a more user-friendly way
     with st.expander("⚠️ Important: Please Read Before Using", expanded=False):
@@ -392,17 +591,73 @@ def main():
     
     # Route to appropriate page
     if page == "📄 Analyze My Contract":
-        contract_analysis_page(doc_processor, nlp_pipeline, risk_engine, explainer, audit_logger)
+        contract_analysis_page(*load_components(
+            get_doc_processor, get_nlp_pipeline, get_risk_engine, get_explainer, get_audit_logger
+        ))
     elif page == "📝 Contract Templates":
+        template_manager = load_components(get_template_manager)[0]
         contract_templates_page(template_manager)
     elif page == "📚 Risk Guide":
         risk_guide_page()
     elif page == "ℹ️ About ContractGuard":
         about_page()
 
+@st.cache_resource
+def get_analysis_executor():
+    """Shared worker pool that runs the blocking analysis stages off the script thread"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="contract-analysis")
+
+@st.cache_resource
+def get_explanation_executor():
+    """Background workers that prefetch LLM responses after an upload"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="explanation-prefetch")
+
+# Analysis stages memoized by document hash, so widget reruns on the results
+# tabs do not re-run extraction, NLP and risk scoring for the same upload
+@st.cache_data(show_spinner=False, max_entries=8)
+def run_document_processing(_doc_processor, _stream, file_name, document_hash):
+    """Extract text from the uploaded document"""
+    return _doc_processor.process_document_stream(_stream, file_name, document_hash)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def run_contract_processing(_nlp_pipeline, document_hash, _text):
+    """Run the NLP pipeline over the extracted text"""
+    return _nlp_pipeline.process_contract(_text)
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def run_risk_analysis(_risk_engine, document_hash, _clauses):
+    """Score the parsed clauses for risks"""
+    return _risk_engine.analyze_contract_risks(_clauses)
+
+def _run_in_script_context(ctx, stage, *args):
+    """Run a stage on a worker thread attached to the calling script run"""
+    add_script_run_ctx(threading.current_thread(), ctx)
+    return stage(*args)
+
+def run_stage_with_progress(placeholder, steps, stage, *args):
+    """Run an analysis stage on the worker pool, refreshing the progress steps until it finishes"""
+    future = get_analysis_executor().submit(_run_in_script_context, get_script_run_ctx(), stage, *args)
+    started = time.monotonic()
+    while not future.done():
+        render_progress_steps(placeholder, steps, time.monotonic() - started)
+        wait((future,), timeout=PROGRESS_POLL_SECONDS)
+    return future.result()
+
+def render_progress_steps(placeholder, steps, elapsed=None):
+    """Replace the placeholder's contents with the current analysis progress steps"""
+    step_html = "".join(
+        f'<div class="progress-step {"completed" if completed else ("active" if active else "")}">'
+        f'{"✅" if completed else ("🔄" if active else "⏳")} {step_name}</div>'
+        for step_name, completed, active in steps
+    )
+    elapsed_label = f" ({elapsed:.0f}s)" if elapsed is not None else ""
+    placeholder.markdown(f"### 🔄 Analysis Progress{elapsed_label}\n\n{step_html}", unsafe_allow_html=True)
+
 def contract_analysis_page(doc_processor, nlp_pipeline, risk_engine, explainer, audit_logger):
     """Contract analysis page"""
     
+    st.markdown(ANALYSIS_CSS, unsafe_allow_html=True)
+    
     st.markdown("## 📄 Contract Analysis")
     st.markdown("Upload your contract to get instant risk analysis and plain-language explanations.")
     
@@ -422,98 +677,37 @@ def contract_analysis_page(doc_processor, nlp_pipeline, risk_engine, explainer,
     )
     
     # Clean privacy notice
-    st.info("🔒 **Your Privacy is Protected:** Your document is processed locally and never stored or shared.")
+    if PREFETCH_LLM_RESPONSES:
+        st.info("🔒 **Your Privacy:** Your document is never stored. Its clauses are sent to the configured AI provider as soon as it is analyzed, to prepare AI explanations.")
+    else:
+        st.info("🔒 **Your Privacy is Protected:** Your document is processed locally and never stored or shared.")
     
     if uploaded_file is not None:
-        # Progress indicator
-        progress_container = st.container()
-        with progress_container:
-            st.markdown("### 🔄 Analysis Progress")
-            
-            # Step indicators
-            steps = [
-                ("📄 Document Upload", True, True),
-                ("🔍 Text Extraction", True, False),
-                ("🧠 AI Analysis", False, False),
-                ("⚠️ Risk Assessment", False, False),
-                ("📊 Results Ready", False, False)
-            ]
-            
-            for step_name, completed, active in steps:
-                status_class = "completed" if completed else ("active" if active else "")
-                icon = "✅" if completed else ("🔄" if active else "⏳")
-                st.markdown(f"""
-                <div class="progress-step {status_class}">
-                    {icon} {step_name}
-                </div>
-                """, unsafe_allow_html=True)
-        
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=f".{uploaded_file.name.split('.')[-1]}") as tmp_file:
-            tmp_file.write(uploaded_file.getvalue())
-            tmp_file_path = tmp_file.name
-        
         try:
-            # Process document with progress updates
-            with st.spinner("🔍 Extracting text from your document..."):
-                doc_result = doc_processor.process_document(tmp_file_path)
-                
-                # Update progress
-                steps[1] = ("🔍 Text Extraction", True, True)
-                steps[2] = ("🧠 AI Analysis", False, True)
-                
-                # Log document processing
-                if audit_logger:
-                    audit_logger.log_document_upload(
-                        filename=uploaded_file.name,
-                        file_size=len(uploaded_file.getvalue()),
-                        document_hash=doc_result['document_hash']
-                    )
+            # Results are kept per upload for the session, so widget reruns on
+            # the results tabs skip straight to rendering; the full document
+            # hash is only computed when an upload is analyzed
+            upload_key = (uploaded_file.file_id, uploaded_file.size)
+            analysis_results = st.session_state.setdefault("analysis_results", {})
+            if upload_key not in analysis_results:
+                document_hash = doc_processor.generate_document_hash(uploaded_file)
+                analysis_results[upload_key] = analyze_uploaded_contract(
+                    uploaded_file, document_hash, doc_processor, nlp_pipeline, risk_engine, explainer, audit_logger
+                )
+                while len(analysis_results) > MAX_SESSION_ANALYSES:
+                    analysis_results.pop(next(iter(analysis_results)))
+            doc_result, contract_analysis, risk_analysis = analysis_results[upload_key]
             
             # Document info cards
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="metric-value">{doc_result['file_size_bytes'] / 1024:.1f} KB</div>
-                    <div class="metric-label">File Size</div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.metric("File Size", f"{doc_result['file_size_bytes'] / 1024:.1f} KB")
             
             with col2:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="metric-value">{doc_result['word_count']:,}</div>
-                    <div class="metric-label">Words</div>
-                </div>
-                """, unsafe_allow_html=True)
+                st.metric("Words", f"{doc_result['word_count']:,}")
             
             with col3:
-                pages_count = doc_result['extraction_metadata'].get('pages', 'N/A')
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="metric-value">{pages_count}</div>
-                    <div class="metric-label">Pages</div>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            # Contract analysis
-            with st.spinner("🧠 Analyzing contract with AI..."):
-                contract_analysis = nlp_pipeline.process_contract(doc_result['extracted_text'])
-                
-                # Update progress
-                steps[2] = ("🧠 AI Analysis", True, True)
-                steps[3] = ("⚠️ Risk Assessment", False, True)
-                
-            with st.spinner("⚠️ Assessing risks..."):
-                risk_analysis = risk_engine.analyze_contract_risks(contract_analysis['clauses'])
-                
-                # Update progress - all complete
-                steps[3] = ("⚠️ Risk Assessment", True, True)
-                steps[4] = ("📊 Results Ready", True, True)
-            
-            # Clear progress and show results
-            progress_container.empty()
+                st.metric("Pages", doc_result['extraction_metadata'].get('pages', 'N/A'))
             
             # Success message
             st.success("✅ Analysis Complete! Your contract has been analyzed successfully.")
@@ -537,14 +731,6 @@ def contract_analysis_page(doc_processor, nlp_pipeline, risk_engine, explainer,
             
             with tab4:
                 display_recommendations(contract_analysis, risk_analysis, explainer)
-            
-            # Log analysis completion
-            if audit_logger:
-                audit_logger.log_analysis_completion(
-                    document_hash=doc_result['document_hash'],
-                    contract_type=contract_analysis['contract_type'],
-                    risk_score=risk_analysis['overall_score']
-                )
         
         except Exception as e:
             st.error(f"❌ **Analysis Failed:** {str(e)}")
@@ -556,11 +742,111 @@ def contract_analysis_page(doc_processor, nlp_pipeline, risk_engine, explainer,
             - Contact support if the problem persists
             """)
             logger.error(f"Document processing error: {str(e)}")
+
+def analyze_uploaded_contract(uploaded_file, document_hash, doc_processor, nlp_pipeline, risk_engine, explainer, audit_logger):
+    """Run extraction, NLP and risk analysis for an upload, showing live progress"""
+    # Progress indicator
+    progress_placeholder = st.empty()
+    
+    # Step indicators
+    steps = [
+        ("📄 Document Upload", True, True),
+        ("🔍 Text Extraction", True, False),
+        ("🧠 AI Analysis", False, False),
+        ("⚠️ Risk Assessment", False, False),
+        ("📊 Results Ready", False, False)
+    ]
+    render_progress_steps(progress_placeholder, steps)
+    
+    # Process document with progress updates
+    with st.spinner("🔍 Extracting text from your document..."):
+        # Spool the upload: small files stay in memory, larger ones spill to an
+        # anonymous temp file that is removed as soon as the buffer is closed
+        with tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_BYTES) as upload_buffer:
+            uploaded_file.seek(0)
+            shutil.copyfileobj(uploaded_file, upload_buffer, length=UPLOAD_COPY_CHUNK_BYTES)
+            file_size = upload_buffer.tell()
+            
+            doc_result = run_stage_with_progress(
+                progress_placeholder, steps, run_document_processing,
+                doc_processor, upload_buffer, uploaded_file.name, document_hash
+            )
+        
+        # Update progress
+        steps[1] = ("🔍 Text Extraction", True, True)
+        steps[2] = ("🧠 AI Analysis", False, True)
+        render_progress_steps(progress_placeholder, steps)
+        
+        # Log document processing
+        if audit_logger:
+            audit_logger.log_document_upload(
+                filename=uploaded_file.name,
+                file_size=file_size,
+                document_hash=doc_result['document_hash']
+            )
+    
+    # Contract analysis
+    with st.spinner("🧠 Analyzing contract with AI..."):
+        contract_analysis = run_stage_with_progress(
+            progress_placeholder, steps, run_contract_processing,
+            nlp_pipeline, document_hash, doc_result['extracted_text']
+        )
         
-        finally:
-            # Clean up temporary file
-            if os.path.exists(tmp_file_path):
-                os.unlink(tmp_file_path)
+        # Derived once here; the compliance check and its prefetch both use it
+        clauses = contract_analysis['clauses']
+        contract_analysis['first_clause_text'] = clauses[0].text if clauses else ""
+        
+        # Update progress
+        steps[2] = ("🧠 AI Analysis", True, True)
+        steps[3] = ("⚠️ Risk Assessment", False, True)
+        render_progress_steps(progress_placeholder, steps)
+        
+    with st.spinner("⚠️ Assessing risks..."):
+        risk_analysis = run_stage_with_progress(
+            progress_placeholder, steps, run_risk_analysis,
+            risk_engine, document_hash, contract_analysis['clauses']
+        )
+        
+        # Update progress - all complete
+        steps[3] = ("⚠️ Risk Assessment", True, True)
+        steps[4] = ("📊 Results Ready", True, True)
+        render_progress_steps(progress_placeholder, steps)
+    
+    # Clear progress before the results are shown
+    progress_placeholder.empty()
+    
+    # Log analysis completion
+    if audit_logger:
+        audit_logger.log_analysis_completion(
+            document_hash=doc_result['document_hash'],
+            contract_type=contract_analysis['contract_type'],
+            risk_score=risk_analysis['overall_score']
+        )
+    
+    if explainer.llm_available and PREFETCH_LLM_RESPONSES:
+        prefetch_llm_responses(explainer, contract_analysis, risk_analysis)
+    
+    return doc_result, contract_analysis, risk_analysis
+
+def prefetch_llm_responses(explainer, contract_analysis, risk_analysis):
+    """Warm the explainer's response cache in the background for the AI buttons on the results tabs
+    
+    Each call mirrors the arguments its button handler uses, so the click is
+    answered from the cache once the prefetch has finished.
+    """
+    executor = get_explanation_executor()
+    contract_type = contract_analysis['contract_type']
+    
+    # Compliance check and negotiation ideas for the top high risks are the
+    # quickest to need, so they are queued ahead of the per-clause explanations
+    executor.submit(
+        explainer.detect_compliance_concerns,
+        contract_analysis['first_clause_text'],
+        contract_type
+    )
+    for risk in islice(risk_analysis['risk_summary']['HIGH'], 3):
+        executor.submit(explainer.suggest_negotiations, risk.clause_text, [risk], risk.risk_type)
+    executor.submit(explainer.explain_clauses_batch, contract_analysis['clauses'], contract_type)
 
 def display_contract_overview(contract_analysis, risk_analysis, explainer):
     """Display contract overview with enhanced UI"""
@@ -621,77 +907,42 @@ def display_contract_overview(contract_analysis, risk_analysis, explainer):
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        st.markdown(f"""
-        <div class="metric-card" style="border-left: 4px solid #991B1B;">
-            <div class="metric-value" style="color: #991B1B;">{risk_analysis['high_risk_count']}</div>
-            <div class="metric-label">🔴 High Priority Issues</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("🔴 High Priority Issues", risk_analysis['high_risk_count'])
     
     with col2:
-        st.markdown(f"""
-        <div class="metric-card" style="border-left: 4px solid #92400E;">
-            <div class="metric-value" style="color: #92400E;">{risk_analysis['medium_risk_count']}</div>
-            <div class="metric-label">🟡 Medium Priority Issues</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("🟡 Medium Priority Issues", risk_analysis['medium_risk_count'])
     
     with col3:
-        st.markdown(f"""
-        <div class="metric-card" style="border-left: 4px solid #065F46;">
-            <div class="metric-value" style="color: #065F46;">{risk_analysis['low_risk_count']}</div>
-            <div class="metric-label">🟢 Low Priority Issues</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("🟢 Low Priority Issues", risk_analysis['low_risk_count'])
     
     # Key insights
-    if risk_analysis['high_risk_count'] > 0:
+    high_risks = risk_analysis['risk_summary']['HIGH']
+    if high_risks:
         st.markdown("### 🚨 Immediate Attention Required")
-        high_risks = risk_analysis['risk_summary']['HIGH'][:3]  # Show top 3
-        for i, risk in enumerate(high_risks, 1):
-            st.markdown(f"""
-            <div class="risk-high">
-                <strong>{i}. {risk.risk_type.replace('_', ' ').title()}</strong><br>
-                <span style="color: var(--neutral-gray);">{risk.sme_concern}</span>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown("".join(
+            TOP_RISK_HTML.format(
+                number=i,
+                risk_type=risk.risk_type.replace('_', ' ').title(),
+                sme_concern=risk.sme_concern
+            )
+            for i, risk in enumerate(islice(high_risks, 3), 1)  # Show top 3
+        ), unsafe_allow_html=True)
     
     # Contract statistics
     st.markdown("### 📈 Contract Analysis Statistics")
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{len(contract_analysis['clauses'])}</div>
-            <div class="metric-label">Clauses Analyzed</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Clauses Analyzed", len(contract_analysis['clauses']))
     
     with col2:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{len(contract_analysis['entities'])}</div>
-            <div class="metric-label">Key Terms Found</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Key Terms Found", len(contract_analysis['entities']))
     
     with col3:
-        ambiguity_count = len(contract_analysis.get('ambiguities', []))
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{ambiguity_count}</div>
-            <div class="metric-label">Unclear Terms</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Unclear Terms", len(contract_analysis.get('ambiguities', [])))
     
     with col4:
-        st.markdown(f"""
-        <div class="metric-card">
-            <div class="metric-value">{risk_analysis['total_risks']}</div>
-            <div class="metric-label">Total Risk Flags</div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Total Risk Flags", risk_analysis['total_risks'])
     
     # Executive summary generation
     if st.button("📋 Generate Executive Summary", help="Create a business-friendly summary of this contract"):
@@ -721,52 +972,34 @@ def display_risk_analysis(risk_analysis, explainer):
     with col2:
         risk_filter = st.selectbox(
             "Show risks:",
-            ["All Risks", "🔴 High Priority", "🟡 Medium Priority", "🟢 Low Priority"],
-            help="Filter risks by their priority level"
+            list(RISK_FILTER_MAP),
+            help="Filter risks by their priority level",
+            key="risk_filter"
         )
     
     # Map filter to backend values
-    filter_mapping = {
-        "All Risks": "All",
-        "🔴 High Priority": "HIGH", 
-        "🟡 Medium Priority": "MEDIUM",
-        "🟢 Low Priority": "LOW"
-    }
-    backend_filter = filter_mapping[risk_filter]
+    backend_filter = RISK_FILTER_MAP[risk_filter]
     
     # Display risks by category with enhanced styling
+    risk_summary = risk_analysis['risk_summary']
     for risk_level in ["HIGH", "MEDIUM", "LOW"]:
         if backend_filter != "All" and backend_filter != risk_level:
             continue
             
-        risks = risk_analysis['risk_summary'][risk_level]
+        risks = risk_summary[risk_level]
         if not risks:
             continue
         
         # Risk level header with appropriate styling
-        if risk_level == "HIGH":
-            icon = "🔴"
-            color = "#991B1B"
-            bg_color = "#FEE2E2"
-            border_color = "#FECACA"
-        elif risk_level == "MEDIUM":
-            icon = "🟡"
-            color = "#92400E"
-            bg_color = "#FEF3C7"
-            border_color = "#FED7AA"
-        else:
-            icon = "🟢"
-            color = "#065F46"
-            bg_color = "#D1FAE5"
-            border_color = "#BBF7D0"
-        
-        st.markdown(f"""
-        <div style="background: {bg_color}; padding: 1rem; border-radius: 8px; border: 1px solid {border_color}; margin: 1rem 0;">
-            <h3 style="color: {color}; margin-bottom: 0.5rem;">
-                {icon} {risk_level.title()} Priority Issues ({len(risks)} found)
-            </h3>
-        </div>
-        """, unsafe_allow_html=True)
+        icon, color, bg_color, border_color = RISK_LEVEL_STYLES[risk_level]
+        st.markdown(RISK_LEVEL_BANNER_HTML.format(
+            bg_color=bg_color,
+            border_color=border_color,
+            color=color,
+            icon=icon,
+            title=risk_level.title(),
+            count=len(risks)
+        ), unsafe_allow_html=True)
         
         # Display each risk in an enhanced card
         for i, risk in enumerate(risks):
@@ -778,14 +1011,12 @@ def display_risk_analysis(risk_analysis, explainer):
                 col1, col2 = st.columns([2, 1])
                 
                 with col1:
-                    st.markdown("**📋 What This Means:**")
-                    st.write(risk.description)
-                    
-                    st.markdown("**💼 Business Impact:**")
-                    st.write(risk.business_impact)
-                    
-                    st.markdown("**🎯 SME Concern:**")
-                    st.write(risk.sme_concern)
+                    # One markdown element for all the static sections
+                    st.markdown("\n\n".join([
+                        "**📋 What This Means:**", risk.description,
+                        "**💼 Business Impact:**", risk.business_impact,
+                        "**🎯 SME Concern:**", risk.sme_concern
+                    ]))
                 
                 with col2:
                     # Risk score visualization
@@ -857,6 +1088,10 @@ def display_risk_analysis(risk_analysis, explainer):
         </div>
         """, unsafe_allow_html=True)
 
+def step_clause(delta):
+    """Button callback moving the clause selector; runs before the rerun the click triggers"""
+    st.session_state.clause_index += delta
+
 def display_clause_explanations(contract_analysis, risk_analysis, explainer):
     """Display clause-by-clause explanations with enhanced UI"""
     
@@ -868,57 +1103,55 @@ def display_clause_explanations(contract_analysis, risk_analysis, explainer):
         st.info("ℹ️ No specific clauses were identified in this contract. This might be a simple document or the text extraction needs improvement.")
         return
     
-    # Clause navigation
+    # Clause navigation - a stored index from a previous, longer document
+    # would not be a valid option any more
+    if st.session_state.get("clause_index", 0) >= len(clauses):
+        st.session_state.clause_index = 0
+    
     col1, col2 = st.columns([3, 1])
     with col1:
         st.markdown("### 🔍 Select a Clause to Analyze")
     with col2:
+        # Labels are built once per analysis; the result dict lives in session state
+        clause_labels = contract_analysis.setdefault('clause_labels', tuple(
+            f"Clause {i + 1}: {clause.clause_type.replace('_', ' ').title()}"
+            for i, clause in enumerate(clauses)
+        ))
         clause_index = st.selectbox(
             "Choose clause:",
             range(len(clauses)),
-            format_func=lambda x: f"Clause {x+1}: {clauses[x].clause_type.replace('_', ' ').title()}",
-            help="Select any clause to see detailed analysis"
+            format_func=clause_labels.__getitem__,
+            help="Select any clause to see detailed analysis",
+            key="clause_index"
         )
     
     selected_clause = clauses[clause_index]
     
-    # Clause header with type and risk indicator
-    clause_risks = []
-    for risk_level in ["HIGH", "MEDIUM", "LOW"]:
-        for risk in risk_analysis['risk_summary'][risk_level]:
-            if selected_clause.text in risk.clause_text or risk.clause_text in selected_clause.text:
-                clause_risks.append(risk)
+    # Clause header with type and risk indicator - the risk engine already
+    # indexes flags by clause position, highest score first for display
+    clause_risks = sorted(
+        risk_analysis['clause_risks'].get(f"clause_{clause_index}", []),
+        key=lambda r: r.score,
+        reverse=True
+    )
     
     # Risk indicator for this clause
     if clause_risks:
-        highest_risk = max(clause_risks, key=lambda r: r.score)
-        if highest_risk.score >= 71:
-            risk_badge = "🔴 High Risk"
-            risk_color = "#991B1B"
-            risk_bg = "#FEE2E2"
-        elif highest_risk.score >= 31:
-            risk_badge = "🟡 Medium Risk"
-            risk_color = "#92400E"
-            risk_bg = "#FEF3C7"
-        else:
-            risk_badge = "🟢 Low Risk"
-            risk_color = "#065F46"
-            risk_bg = "#D1FAE5"
+        highest_risk = clause_risks[0]
+        risk_badge, risk_color, risk_bg = CLAUSE_RISK_BADGES[classify_risk(highest_risk.score)]
     else:
         risk_badge = "✅ No Issues"
         risk_color = "#065F46"
         risk_bg = "#D1FAE5"
     
-    st.markdown(f"""
-    <div style="background: {risk_bg}; padding: 1.5rem; border-radius: 12px; border: 1px solid {risk_color}; margin: 1rem 0;">
-        <h3 style="color: {risk_color}; margin-bottom: 0.5rem;">
-            📄 Clause {clause_index + 1}: {selected_clause.clause_type.replace('_', ' ').title()}
-        </h3>
-        <div style="padding: 0.5rem 1rem; border-radius: 6px; display: inline-block; background: var(--bg-subtle); border: 1px solid var(--border-subtle);">
-            <strong>{risk_badge}</strong>
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    clause_type_title = selected_clause.clause_type.replace('_', ' ').title()
+    st.markdown(CLAUSE_HEADER_HTML.format(
+        risk_bg=risk_bg,
+        risk_color=risk_color,
+        number=clause_index + 1,
+        clause_type=clause_type_title,
+        risk_badge=risk_badge
+    ), unsafe_allow_html=True)
     
     # Clause content in two columns
     col1, col2 = st.columns([3, 2])
@@ -935,55 +1168,40 @@ def display_clause_explanations(contract_analysis, risk_analysis, explainer):
         if selected_clause.obligations or selected_clause.rights or selected_clause.prohibitions:
             st.markdown("#### 📋 What This Clause Contains")
             
-            if selected_clause.obligations:
-                st.markdown("**🔸 Your Obligations (What you must do):**")
-                for obligation in selected_clause.obligations:
-                    st.markdown(f"• {obligation}")
-            
-            if selected_clause.rights:
-                st.markdown("**✅ Your Rights (What you can do):**")
-                for right in selected_clause.rights:
-                    st.markdown(f"• {right}")
-            
-            if selected_clause.prohibitions:
-                st.markdown("**❌ Restrictions (What you cannot do):**")
-                for prohibition in selected_clause.prohibitions:
-                    st.markdown(f"• {prohibition}")
+            # All three lists go out as one markdown element
+            parts = []
+            for heading, items in (
+                ("**🔸 Your Obligations (What you must do):**", selected_clause.obligations),
+                ("**✅ Your Rights (What you can do):**", selected_clause.rights),
+                ("**❌ Restrictions (What you cannot do):**", selected_clause.prohibitions)
+            ):
+                if items:
+                    parts.append(heading)
+                    parts.extend(f"• {item}" for item in items)
+            st.markdown("\n\n".join(parts))
     
     with col2:
         # Risk analysis for this clause
         if clause_risks:
             st.markdown("#### ⚠️ Identified Risks")
-            for risk in clause_risks[:2]:  # Show top 2 risks
-                st.markdown(f"""
-                <div style="padding: 1rem 0; border-left: 4px solid {risk_color}; padding-left: 1rem; margin-bottom: 1rem; border-bottom: 1px solid var(--border-subtle);">
-                    <strong>{risk.risk_type.replace('_', ' ').title()}</strong><br>
-                    <span style="color: var(--text-light); font-size: 0.9rem;">Score: {risk.score}/100</span><br>
-                    <span style="font-size: 0.9rem;">{risk.sme_concern}</span>
-                </div>
-                """, unsafe_allow_html=True)
+            st.markdown("".join(
+                CLAUSE_RISK_HTML.format(
+                    risk_color=risk_color,
+                    risk_type=risk.risk_type.replace('_', ' ').title(),
+                    score=risk.score,
+                    sme_concern=risk.sme_concern
+                )
+                for risk in islice(clause_risks, 2)  # Show top 2 risks
+            ), unsafe_allow_html=True)
         else:
             st.markdown("#### ✅ No Major Risks Detected")
             st.success("This clause appears to contain standard business terms without significant risk flags.")
         
         # Quick stats
         st.markdown("#### 📊 Clause Statistics")
-        word_count = len(selected_clause.text.split())
-        char_count = len(selected_clause.text)
-        
-        st.markdown(f"""
-        <div style="padding: 1rem 0; border-bottom: 1px solid var(--border-subtle);">
-            <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
-                <span>Words:</span> <strong>{word_count}</strong>
-            </div>
-            <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem;">
-                <span>Characters:</span> <strong>{char_count}</strong>
-            </div>
-            <div style="display: flex; justify-content: space-between;">
-                <span>Type:</span> <strong>{selected_clause.clause_type.replace('_', ' ').title()}</strong>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.metric("Words", selected_clause.word_count)
+        st.metric("Characters", selected_clause.char_count)
+        st.metric("Type", clause_type_title)
     
     # AI explanation section
     st.markdown("---")
@@ -998,31 +1216,22 @@ def display_clause_explanations(contract_analysis, risk_analysis, explainer):
     if explain_button:
         with st.spinner("🤖 Generating business-friendly explanation..."):
             try:
-                explanation = explainer.explain_clause(
+                st.markdown("#### 💬 Plain Language Explanation")
+                
+                # Render each section as soon as the model finishes writing it
+                sections_placeholder = st.empty()
+                explanation = {section: [] for section in EXPLANATION_SECTION_TITLES}
+                for key, content in explainer.stream_clause_sections(
                     selected_clause.text,
                     selected_clause.clause_type,
                     contract_analysis['contract_type']
-                )
-                
-                st.markdown("#### 💬 Plain Language Explanation")
-                
-                # Display explanation in organized sections
-                explanation_sections = [
-                    ("🎯 What this means in simple terms", explanation.get('simple_explanation', '')),
-                    ("👥 Who benefits from this clause", explanation.get('who_benefits', '')),
-                    ("💼 How this affects your business", explanation.get('business_impact', '')),
-                    ("⚠️ What to watch out for", explanation.get('watch_out_for', '')),
-                    ("📊 Is this standard or unusual?", explanation.get('assessment', ''))
-                ]
-                
-                for title, content in explanation_sections:
-                    if content:
-                        st.markdown(f"**{title}:**")
-                        st.markdown(f"""
-                        <div style="background: #f8fafc; padding: 1rem; border-radius: 8px; border-left: 4px solid var(--secondary-blue); margin-bottom: 1rem;">
-                            {content}
-                        </div>
-                        """, unsafe_allow_html=True)
+                ):
+                    explanation[key].append(content)
+                    sections_placeholder.markdown("".join(
+                        EXPLANATION_SECTION_HTML.format(title=EXPLANATION_SECTION_TITLES[section], content=" ".join(contents))
+                        for section, contents in explanation.items()
+                        if contents
+                    ), unsafe_allow_html=True)
                         
             except Exception as e:
                 st.warning("⚠️ AI explanations require an API key to be configured.")
@@ -1034,16 +1243,37 @@ def display_clause_explanations(contract_analysis, risk_analysis, explainer):
     
     with col1:
         if clause_index > 0:
-            if st.button("⬅️ Previous Clause"):
-                st.rerun()
+            st.button("⬅️ Previous Clause", on_click=step_clause, args=(-1,))
     
     with col2:
         st.markdown(f"<div style='text-align: center; color: var(--neutral-gray);'>Clause {clause_index + 1} of {len(clauses)}</div>", unsafe_allow_html=True)
     
     with col3:
         if clause_index < len(clauses) - 1:
-            if st.button("Next Clause ➡️"):
-                st.rerun()
+            st.button("Next Clause ➡️", on_click=step_clause, args=(1,))
+
+def format_negotiation_suggestions(suggestions):
+    """Markdown for parsed negotiation suggestions, one bold heading per non-empty category"""
+    parts = []
+    for category, items in suggestions.items():
+        if items:
+            parts.append(f"**{category.replace('_', ' ').title()}:**")
+            parts.extend(f"• {item}" for item in items)
+    return "\n\n".join(parts)
+
+def iter_priority_actions(high_count, medium_count):
+    """Yield (priority, action, timeline) rows for the Priority Actions list"""
+    if high_count:
+        yield ("🔴 URGENT", f"Have a lawyer review {high_count} high-risk clauses", "Within 24 hours")
+        yield ("📞 CRITICAL", "Schedule legal consultation before signing", "Immediately")
+        yield ("📋 PREPARE", "List specific questions about flagged risks", "Before lawyer meeting")
+    
+    if medium_count:
+        yield ("🟡 IMPORTANT", f"Review {medium_count} medium-risk clauses carefully", "Within 1 week")
+        yield ("💬 NEGOTIATE", "Consider requesting changes to problematic terms", "Before signing")
+    
+    yield ("✅ VERIFY", "Ensure you understand all your obligations", "Before signing")
+    yield ("📄 DOCUMENT", "Keep copies of all contract versions and communications", "Always")
 
 def display_recommendations(contract_analysis, risk_analysis, explainer):
     """Display recommendations and next steps with enhanced UI"""
@@ -1057,69 +1287,24 @@ def display_recommendations(contract_analysis, risk_analysis, explainer):
     overall_score = risk_analysis['overall_score']
     
     # Overall recommendation based on risk level
-    if overall_score >= 71:
-        st.markdown("""
-        <div class="risk-high">
-            <h3>🚨 HIGH RISK CONTRACT - Immediate Action Required</h3>
-            <p>This contract contains significant risks that could seriously impact your business. <strong>Do not sign without legal review.</strong></p>
-        </div>
-        """, unsafe_allow_html=True)
-    elif overall_score >= 31:
-        st.markdown("""
-        <div class="risk-medium">
-            <h3>🟡 MEDIUM RISK CONTRACT - Review Recommended</h3>
-            <p>This contract has some concerning terms that should be reviewed and potentially negotiated before signing.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    else:
-        st.markdown("""
-        <div class="risk-low">
-            <h3>✅ LOW RISK CONTRACT - Generally Acceptable</h3>
-            <p>This contract appears to have standard business terms with minimal risk. Still, ensure you understand all obligations.</p>
-        </div>
-        """, unsafe_allow_html=True)
+    css_class, title, body = CONTRACT_VERDICTS[classify_risk(overall_score)]
+    st.markdown(RISK_VERDICT_HTML.format(css_class=css_class, title=title, body=body), unsafe_allow_html=True)
     
     # Priority actions
     if high_risks or medium_risks:
         st.markdown("### 🎯 Priority Actions")
         
-        action_items = []
-        
-        if high_risks:
-            action_items.extend([
-                ("🔴 URGENT", f"Have a lawyer review {len(high_risks)} high-risk clauses", "Within 24 hours"),
-                ("📞 CRITICAL", "Schedule legal consultation before signing", "Immediately"),
-                ("📋 PREPARE", "List specific questions about flagged risks", "Before lawyer meeting")
-            ])
-        
-        if medium_risks:
-            action_items.extend([
-                ("🟡 IMPORTANT", f"Review {len(medium_risks)} medium-risk clauses carefully", "Within 1 week"),
-                ("💬 NEGOTIATE", "Consider requesting changes to problematic terms", "Before signing")
-            ])
-        
-        action_items.extend([
-            ("✅ VERIFY", "Ensure you understand all your obligations", "Before signing"),
-            ("📄 DOCUMENT", "Keep copies of all contract versions and communications", "Always")
-        ])
-        
-        for priority, action, timeline in action_items:
-            st.markdown(f"""
-            <div style="padding: 1rem 0; border-left: 4px solid var(--accent-blue); padding-left: 1rem; margin-bottom: 0.5rem; display: flex; justify-content: space-between; align-items: center; border-bottom: 1px solid var(--border-subtle);">
-                <div>
-                    <strong>{priority}:</strong> {action}
-                </div>
-                <div style="color: var(--text-light); font-size: 0.9rem; font-style: italic;">
-                    {timeline}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+        # All action rows go out as a single markdown element
+        st.markdown("".join(
+            ACTION_ITEM_HTML.format(priority=priority, action=action, timeline=timeline)
+            for priority, action, timeline in iter_priority_actions(len(high_risks), len(medium_risks))
+        ), unsafe_allow_html=True)
     
     # Specific risk-based recommendations
     if high_risks:
         st.markdown("### 🚨 High-Risk Issues Requiring Attention")
         
-        for i, risk in enumerate(high_risks[:3], 1):  # Show top 3 high risks
+        for i, risk in enumerate(islice(high_risks, 3), 1):  # Show top 3 high risks
             with st.expander(f"🔴 Issue {i}: {risk.risk_type.replace('_', ' ').title()}", expanded=True):
                 col1, col2 = st.columns([2, 1])
                 
@@ -1147,21 +1332,25 @@ def display_recommendations(contract_analysis, risk_analysis, explainer):
                 if st.button(f"💡 Get Negotiation Ideas", key=f"negotiate_{i}"):
                     with st.spinner("🤖 Generating negotiation suggestions..."):
                         try:
-                            suggestions = explainer.suggest_negotiations(
-                                risk.clause_text,
-                                [risk],
-                                risk.risk_type
-                            )
-                            
                             st.markdown("**🤝 Negotiation Suggestions:**")
                             st.info("These are business negotiation ideas, not legal advice. Have any changes reviewed by a lawyer.")
                             
-                            for category, items in suggestions.items():
-                                if items:
-                                    category_title = category.replace('_', ' ').title()
-                                    st.markdown(f"**{category_title}:**")
-                                    for item in items:
-                                        st.write(f"• {item}")
+                            # Re-render the categories as lines stream in; a partial
+                            # last line is held back until it is complete
+                            suggestions_placeholder = st.empty()
+                            suggestions_text = ""
+                            for chunk in explainer.stream_negotiation_suggestions(
+                                risk.clause_text,
+                                [risk],
+                                risk.risk_type
+                            ):
+                                suggestions_text += chunk
+                                suggestions_placeholder.markdown(format_negotiation_suggestions(
+                                    explainer.parse_negotiation_suggestions(suggestions_text.rpartition('\n')[0])
+                                ))
+                            suggestions_placeholder.markdown(format_negotiation_suggestions(
+                                explainer.parse_negotiation_suggestions(suggestions_text)
+                            ))
                                         
                         except Exception as e:
                             st.warning("⚠️ Negotiation suggestions require an API key. Add your OpenAI or Anthropic key to .env file.")
@@ -1169,22 +1358,10 @@ def display_recommendations(contract_analysis, risk_analysis, explainer):
     # General recommendations
     st.markdown("### 📋 General Best Practices")
     
-    recommendations = [
-        ("🔍 **Understand Before Signing**", "Make sure you fully understand every clause and your obligations"),
-        ("⚖️ **Get Legal Review**", "Have a qualified lawyer review any contract with significant business impact"),
-        ("💬 **Ask Questions**", "Prepare specific questions about unclear terms or concerning clauses"),
-        ("🤝 **Negotiate When Possible**", "Many contract terms are negotiable, especially if you bring value"),
-        ("📋 **Document Everything**", "Keep records of all negotiations, changes, and communications"),
-        ("⏰ **Set Reminders**", "Create calendar reminders for key dates like renewal or termination deadlines"),
-        ("🔄 **Review Regularly**", "Periodically review your contracts to ensure ongoing compliance")
-    ]
-    
-    for title, description in recommendations:
-        st.markdown(f"""
-        <div style="padding: 1rem 0; border-bottom: 1px solid var(--border-subtle); margin-bottom: 0.5rem;">
-            {title}: {description}
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown("".join(
+        BEST_PRACTICE_HTML.format(title=title, description=description)
+        for title, description in BEST_PRACTICES
+    ), unsafe_allow_html=True)
     
     # Compliance check
     st.markdown("### ⚖️ Compliance Considerations")
@@ -1197,7 +1374,7 @@ def display_recommendations(contract_analysis, risk_analysis, explainer):
             with st.spinner("🤖 Checking for compliance concerns..."):
                 try:
                     concerns = explainer.detect_compliance_concerns(
-                        contract_analysis.get('clauses', [{}])[0].text if contract_analysis.get('clauses') else "",
+                        contract_analysis['first_clause_text'],
                         contract_analysis['contract_type']
                     )
                     
@@ -1221,28 +1398,21 @@ def display_recommendations(contract_analysis, risk_analysis, explainer):
     with col1:
         if st.button("📋 Download Summary", use_container_width=True):
             # Create a simple text summary
-            summary_text = f"""
-CONTRACT ANALYSIS SUMMARY
-========================
-
-Contract Type: {contract_analysis['contract_type']}
-Overall Risk Level: {risk_analysis['overall_level']} ({risk_analysis['overall_score']}/100)
-
-Risk Breakdown:
-- High Priority Issues: {risk_analysis['high_risk_count']}
-- Medium Priority Issues: {risk_analysis['medium_risk_count']}
-- Low Priority Issues: {risk_analysis['low_risk_count']}
-
-DISCLAIMER: This analysis is for educational purposes only and does not constitute legal advice.
-Always consult qualified legal professionals for legal matters.
-
-Generated by ContractGuard - {datetime.now().strftime('%Y-%m-%d %H:%M')}
-            """
+            generated_at = datetime.now()
+            summary_text = SUMMARY_TEXT_TEMPLATE.format(
+                contract_type=contract_analysis['contract_type'],
+                overall_level=risk_analysis['overall_level'],
+                overall_score=risk_analysis['overall_score'],
+                high_risk_count=risk_analysis['high_risk_count'],
+                medium_risk_count=risk_analysis['medium_risk_count'],
+                low_risk_count=risk_analysis['low_risk_count'],
+                generated_at=generated_at.strftime('%Y-%m-%d %H:%M')
+            )
             
             st.download_button(
                 label="📄 Download Text Summary",
                 data=summary_text,
-                file_name=f"contract_analysis_{datetime.now().strftime('%Y%m%d_%H%M')}.txt",
+                file_name=f"contract_analysis_{generated_at.strftime('%Y%m%d_%H%M')}.txt",
                 mime="text/plain"
             )
     
@@ -1350,56 +1520,7 @@ def risk_guide_page():
     st.header("📚 Risk Assessment Guide")
     st.markdown("Learn about common contract risks and how to protect your business.")
     
-    # Risk categories
-    risk_categories = {
-        "Financial Risks": {
-            "description": "Risks that could cost your business money",
-            "examples": [
-                "Penalty clauses for delays",
-                "Unlimited liability exposure", 
-                "Personal guarantees",
-                "Liquidated damages"
-            ],
-            "protection": [
-                "Negotiate liability caps",
-                "Avoid personal guarantees when possible",
-                "Ensure penalty amounts are reasonable",
-                "Include force majeure clauses"
-            ]
-        },
-        "Operational Risks": {
-            "description": "Risks that could disrupt your business operations",
-            "examples": [
-                "Exclusive dealing arrangements",
-                "Non-compete clauses",
-                "Unilateral termination rights",
-                "Restrictive IP assignments"
-            ],
-            "protection": [
-                "Maintain multiple supplier/customer relationships",
-                "Negotiate mutual termination rights",
-                "Limit non-compete duration and scope",
-                "Retain rights to pre-existing IP"
-            ]
-        },
-        "Legal & Compliance Risks": {
-            "description": "Risks related to legal compliance and disputes",
-            "examples": [
-                "Unfavorable jurisdiction clauses",
-                "Mandatory arbitration",
-                "Indemnification obligations",
-                "Regulatory compliance gaps"
-            ],
-            "protection": [
-                "Choose convenient jurisdiction",
-                "Include mutual indemnification",
-                "Ensure compliance with local laws",
-                "Add legal review requirements"
-            ]
-        }
-    }
-    
-    for category, info in risk_categories.items():
+    for category, info in RISK_CATEGORIES.items():
         with st.expander(f"📊 {category}", expanded=False):
             st.write(f"**What it is:** {info['description']}")
             
@@ -1500,20 +1621,24 @@ def about_page():
     # System status
     st.subheader("🔧 System Status")
     
-    # Check component status
+    # Check component status - only the template manager is built here; the
+    # analysis components are only checked for being installed, since loading
+    # them would cold-start the NLP pipeline just to print this page
     try:
-        doc_processor, nlp_pipeline, risk_engine, explainer, template_manager, audit_logger = initialize_components()
+        template_manager = get_template_manager()
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.success("✅ Document Processing")
-            st.success("✅ NLP Pipeline") 
-            st.success("✅ Risk Engine")
+            for label, module_name in COMPONENT_MODULES:
+                if importlib.util.find_spec(module_name):
+                    st.success(f"✅ {label} (installed)")
+                else:
+                    st.error(f"❌ {label} (not installed)")
         
         with col2:
             # Check LLM availability
-            if OPENAI_API_KEY or ANTHROPIC_API_KEY:
+            if GEMINI_API_KEY or OPENAI_API_KEY or ANTHROPIC_API_KEY:
                 st.success("✅ LLM Service")
             else:
                 st.warning("⚠️ LLM Service (Limited)")
@@ -1,17 +1,35 @@
 """
 Configuration settings for the Legal Contract Assistant
 """
+import bisect
 import os
 from dotenv import load_dotenv
 
 # Load environment variables with override to ensure fresh loading
 load_dotenv(override=True)
 
+def _env_int(name, default, minimum=1):
+    """Read an integer setting from the environment, keeping the default if it is unset or invalid"""
+    try:
+        return max(minimum, int(os.getenv(name, default)))
+    except ValueError:
+        return default
+
 # LLM Configuration
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 DEFAULT_LLM_MODEL = "gemini-2.5-flash"  # or "gpt-4", "claude-3-opus-20240229"
+LLM_CACHE_MAX_ENTRIES = 512  # Cached LLM responses kept in memory per process
+# Optional SQLite file that keeps LLM responses across restarts; unset keeps
+# them in memory only, in line with the no-retention default below
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH")
+LLM_CONCURRENCY = _env_int("LLM_CONCURRENCY", 8)  # Max LLM requests in flight per batch of clauses
+# Send every clause, the compliance check and the top negotiation prompts to
+# the LLM as soon as a contract is analyzed, so the AI buttons answer at once.
+# Off unless opted in: it shares the contract with the provider (and spends
+# API quota) before the user asks for any AI explanation
+PREFETCH_LLM_RESPONSES = os.getenv("PREFETCH_LLM_RESPONSES", "").lower() in ("1", "true", "yes")
 
 # Risk Scoring Thresholds
 RISK_THRESHOLDS = {
@@ -20,26 +38,34 @@ RISK_THRESHOLDS = {
     "HIGH": (71, 100)
 }
 
+# Upper bound of every band but the last, for bisecting a score into its band
+_RISK_LABELS = tuple(RISK_THRESHOLDS)
+_RISK_CUTOFFS = tuple(high for _, high in list(RISK_THRESHOLDS.values())[:-1])
+
+def classify_risk(score):
+    """Map a 0-100 risk score to its RISK_THRESHOLDS level"""
+    return _RISK_LABELS[bisect.bisect_left(_RISK_CUTOFFS, score)]
+
 # Supported File Types
-SUPPORTED_FILE_TYPES = [".pdf", ".docx", ".txt"]
+SUPPORTED_FILE_TYPES = frozenset({".pdf", ".docx", ".txt"})
 MAX_FILE_SIZE_MB = 10
 
 # Contract Types
-CONTRACT_TYPES = [
+CONTRACT_TYPES = (
     "Employment Agreement",
     "Vendor/Supplier Contract", 
     "Lease & Rental Agreement",
     "Partnership Deed",
     "Service Agreement",
     "NDA/Confidentiality Agreement"
-]
+)
 
 # High-Risk Clause Keywords
-HIGH_RISK_KEYWORDS = [
+HIGH_RISK_KEYWORDS = (
     "penalty", "liquidated damages", "indemnity", "indemnification",
     "unilateral termination", "auto-renewal", "non-compete", 
     "exclusive", "irrevocable", "unconditional", "unlimited liability"
-]
+)
 
 # Audit Configuration
 ENABLE_AUDIT_LOGGING = True
@@ -50,6 +76,66 @@ DOCUMENT_RETENTION_DAYS = 0  # 0 means no retention unless user opts in
 APP_TITLE = "Legal Contract Assistant for Indian SMEs"
 APP_DESCRIPTION = "Understand contracts, identify risks, get plain-language explanations"
 
+# Guidance content - kept here rather than in app.py, which Streamlit
+# re-executes on every rerun, so these are built once per process
+BEST_PRACTICES = (
+    ("🔍 **Understand Before Signing**", "Make sure you fully understand every clause and your obligations"),
+    ("⚖️ **Get Legal Review**", "Have a qualified lawyer review any contract with significant business impact"),
+    ("💬 **Ask Questions**", "Prepare specific questions about unclear terms or concerning clauses"),
+    ("🤝 **Negotiate When Possible**", "Many contract terms are negotiable, especially if you bring value"),
+    ("📋 **Document Everything**", "Keep records of all negotiations, changes, and communications"),
+    ("⏰ **Set Reminders**", "Create calendar reminders for key dates like renewal or termination deadlines"),
+    ("🔄 **Review Regularly**", "Periodically review your contracts to ensure ongoing compliance")
+)
+
+RISK_CATEGORIES = {
+    "Financial Risks": {
+        "description": "Risks that could cost your business money",
+        "examples": [
+            "Penalty clauses for delays",
+            "Unlimited liability exposure", 
+            "Personal guarantees",
+            "Liquidated damages"
+        ],
+        "protection": [
+            "Negotiate liability caps",
+            "Avoid personal guarantees when possible",
+            "Ensure penalty amounts are reasonable",
+            "Include force majeure clauses"
+        ]
+    },
+    "Operational Risks": {
+        "description": "Risks that could disrupt your business operations",
+        "examples": [
+            "Exclusive dealing arrangements",
+            "Non-compete clauses",
+            "Unilateral termination rights",
+            "Restrictive IP assignments"
+        ],
+        "protection": [
+            "Maintain multiple supplier/customer relationships",
+            "Negotiate mutual termination rights",
+            "Limit non-compete duration and scope",
+            "Retain rights to pre-existing IP"
+        ]
+    },
+    "Legal & Compliance Risks": {
+        "description": "Risks related to legal compliance and disputes",
+        "examples": [
+            "Unfavorable jurisdiction clauses",
+            "Mandatory arbitration",
+            "Indemnification obligations",
+            "Regulatory compliance gaps"
+        ],
+        "protection": [
+            "Choose convenient jurisdiction",
+            "Include mutual indemnification",
+            "Ensure compliance with local laws",
+            "Add legal review requirements"
+        ]
+    }
+}
+
 # Disclaimers
 LEGAL_DISCLAIMER = """
 ⚠️ IMPORTANT DISCLAIMER:
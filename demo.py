@@ -2,7 +2,10 @@
 Demo script for Legal Contract Assistant
 Shows the system working without the web interface
 """
+import io
 import sys
+from collections import Counter, defaultdict
+from functools import partial
 from pathlib import Path
 
 # Add src to path
@@ -14,11 +17,10 @@ def demo_contract_analysis():
     print("=" * 50)
     
     # Import modules
-    from src.document_processor import DocumentProcessor
     from src.nlp_pipeline import LegalNLPPipeline
     from src.risk_engine import ContractRiskEngine
-    from src.llm_explainer import LegalExplainer
     from src.contract_templates import ContractTemplateManager
+    from config import classify_risk
     
     # Sample contract text
     sample_contract = """
@@ -68,91 +70,93 @@ def demo_contract_analysis():
     contract_analysis = nlp_pipeline.process_contract(sample_contract)
     risk_analysis = risk_engine.analyze_contract_risks(contract_analysis['clauses'])
     
-    # Display results
-    print("\n📊 ANALYSIS RESULTS")
-    print("=" * 50)
-    
-    print(f"📋 Contract Type: {contract_analysis['contract_type']}")
-    print(f"🎯 Confidence: {contract_analysis['type_confidence']:.1%}")
-    print(f"📝 Clauses Found: {len(contract_analysis['clauses'])}")
-    print(f"🏷️  Entities Extracted: {len(contract_analysis['entities'])}")
-    
-    print(f"\n⚠️ RISK ASSESSMENT")
-    print("-" * 30)
-    print(f"Overall Risk Score: {risk_analysis['overall_score']}/100")
-    print(f"Risk Level: {risk_analysis['overall_level']}")
-    print(f"🔴 High Risks: {risk_analysis['high_risk_count']}")
-    print(f"🟡 Medium Risks: {risk_analysis['medium_risk_count']}")
-    print(f"🟢 Low Risks: {risk_analysis['low_risk_count']}")
-    
-    # Show high-risk issues
-    if risk_analysis['high_risk_count'] > 0:
-        print(f"\n🚨 HIGH-RISK ISSUES:")
-        print("-" * 30)
-        for risk in risk_analysis['risk_summary']['HIGH']:
-            print(f"• {risk.risk_type.replace('_', ' ').title()}")
-            print(f"  Score: {risk.score}/100")
-            print(f"  Concern: {risk.sme_concern}")
-            print()
-    
-    # Show entities
-    print("🏷️  EXTRACTED ENTITIES:")
-    print("-" * 30)
-    entity_types = {}
-    for entity in contract_analysis['entities']:
-        if entity.label not in entity_types:
-            entity_types[entity.label] = []
-        entity_types[entity.label].append(entity.text)
-    
-    for entity_type, entities in entity_types.items():
-        print(f"{entity_type}: {', '.join(set(entities))}")
-    
-    # Show clause types
-    print(f"\n📝 CLAUSE BREAKDOWN:")
-    print("-" * 30)
-    clause_types = {}
-    for clause in contract_analysis['clauses']:
-        clause_type = clause.clause_type
-        if clause_type not in clause_types:
-            clause_types[clause_type] = 0
-        clause_types[clause_type] += 1
-    
-    for clause_type, count in clause_types.items():
-        print(f"{clause_type.replace('_', ' ').title()}: {count}")
-    
-    # Show templates
-    print(f"\n📋 AVAILABLE TEMPLATES:")
-    print("-" * 30)
-    templates = template_manager.get_template_summary()
-    for template_name, template_info in templates.items():
-        print(f"• {template_info['name']}")
-        print(f"  Use case: {template_info['use_case']}")
-    
-    print(f"\n✅ RECOMMENDATIONS:")
-    print("-" * 30)
-    if risk_analysis['overall_score'] >= 71:
-        print("🔴 HIGH RISK CONTRACT - Immediate attention required!")
-        print("• Have a lawyer review this contract before signing")
-        print("• Negotiate to reduce high-risk clauses")
-        print("• Consider liability limitations")
-    elif risk_analysis['overall_score'] >= 31:
-        print("🟡 MEDIUM RISK CONTRACT - Review recommended")
-        print("• Review identified risks carefully")
-        print("• Consider negotiating problematic clauses")
-        print("• Ensure you understand all obligations")
-    else:
-        print("🟢 LOW RISK CONTRACT - Generally acceptable")
-        print("• Standard business terms detected")
-        print("• Review for completeness")
-        print("• Ensure all details are correct")
-    
-    print(f"\n⚠️  DISCLAIMER:")
-    print("-" * 30)
-    print("This analysis is for educational purposes only and does not constitute legal advice.")
-    print("Always consult qualified legal professionals for legal matters.")
-    
-    print(f"\n🎉 Demo completed successfully!")
-    print("To run the full web application: python run.py")
+    # Display results - buffered and written out in one go
+    report = io.StringIO()
+    out = partial(print, file=report)
+    
+    # Written out even if a later step fails, so partial results are not lost
+    try:
+        out("\n📊 ANALYSIS RESULTS")
+        out("=" * 50)
+        
+        out(f"📋 Contract Type: {contract_analysis['contract_type']}")
+        out(f"🎯 Confidence: {contract_analysis['type_confidence']:.1%}")
+        out(f"📝 Clauses Found: {len(contract_analysis['clauses'])}")
+        out(f"🏷️  Entities Extracted: {len(contract_analysis['entities'])}")
+        
+        out(f"\n⚠️ RISK ASSESSMENT")
+        out("-" * 30)
+        out(f"Overall Risk Score: {risk_analysis['overall_score']}/100")
+        out(f"Risk Level: {risk_analysis['overall_level']}")
+        out(f"🔴 High Risks: {risk_analysis['high_risk_count']}")
+        out(f"🟡 Medium Risks: {risk_analysis['medium_risk_count']}")
+        out(f"🟢 Low Risks: {risk_analysis['low_risk_count']}")
+        
+        # Show high-risk issues
+        if risk_analysis['high_risk_count'] > 0:
+            out(f"\n🚨 HIGH-RISK ISSUES:")
+            out("-" * 30)
+            for risk in risk_analysis['risk_summary']['HIGH']:
+                out(f"• {risk.risk_type.replace('_', ' ').title()}")
+                out(f"  Score: {risk.score}/100")
+                out(f"  Concern: {risk.sme_concern}")
+                out()
+        
+        # Show entities
+        out("🏷️  EXTRACTED ENTITIES:")
+        out("-" * 30)
+        entity_types = defaultdict(set)
+        for entity in contract_analysis['entities']:
+            entity_types[entity.label].add(entity.text)
+        
+        for entity_type, entities in entity_types.items():
+            out(f"{entity_type}: {', '.join(sorted(entities))}")
+        
+        # Show clause types
+        out(f"\n📝 CLAUSE BREAKDOWN:")
+        out("-" * 30)
+        clause_types = Counter(clause.clause_type for clause in contract_analysis['clauses'])
+        
+        for clause_type, count in clause_types.most_common():
+            out(f"{clause_type.replace('_', ' ').title()}: {count}")
+        
+        # Show templates
+        out(f"\n📋 AVAILABLE TEMPLATES:")
+        out("-" * 30)
+        templates = template_manager.get_template_summary()
+        for template_name, template_info in templates.items():
+            out(f"• {template_info['name']}")
+            out(f"  Use case: {template_info['use_case']}")
+        
+        out(f"\n✅ RECOMMENDATIONS:")
+        out("-" * 30)
+        overall_level = classify_risk(risk_analysis['overall_score'])
+        if overall_level == "HIGH":
+            out("🔴 HIGH RISK CONTRACT - Immediate attention required!")
+            out("• Have a lawyer review this contract before signing")
+            out("• Negotiate to reduce high-risk clauses")
+            out("• Consider liability limitations")
+        elif overall_level == "MEDIUM":
+            out("🟡 MEDIUM RISK CONTRACT - Review recommended")
+            out("• Review identified risks carefully")
+            out("• Consider negotiating problematic clauses")
+            out("• Ensure you understand all obligations")
+        else:
+            out("🟢 LOW RISK CONTRACT - Generally acceptable")
+            out("• Standard business terms detected")
+            out("• Review for completeness")
+            out("• Ensure all details are correct")
+        
+        out(f"\n⚠️  DISCLAIMER:")
+        out("-" * 30)
+        out("This analysis is for educational purposes only and does not constitute legal advice.")
+        out("Always consult qualified legal professionals for legal matters.")
+        
+        out(f"\n🎉 Demo completed successfully!")
+        out("To run the full web application: python run.py")
+    finally:
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     demo_contract_analysis()
\ No newline at end of file
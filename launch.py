@@ -45,13 +45,20 @@ def main():
     print("🛑 Press Ctrl+C to stop")
     print()
     
+    command = [
+        sys.executable, "-m", "streamlit", "run", "app.py",
+        "--server.headless", "true",
+        "--server.port", "8501"
+    ]
+    
     try:
-        # Launch Streamlit
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", "app.py",
-            "--server.headless", "true",
-            "--server.port", "8501"
-        ])
+        # Windows has no real exec, so wait on Streamlit there; elsewhere
+        # replace this process and let Streamlit handle Ctrl+C itself
+        if os.name == "nt":
+            subprocess.run(command)
+            return 0
+        sys.stdout.flush()
+        os.execvp(sys.executable, command)
     except KeyboardInterrupt:
         print("\n👋 Application stopped")
         return 0
@@ -4,6 +4,7 @@ Handles startup checks and launches the Streamlit app
 """
 import os
 import sys
+import importlib.util
 import subprocess
 from pathlib import Path
 import logging
@@ -39,23 +40,23 @@ def check_dependencies():
     """Check if required packages are installed"""
     print("📦 Checking dependencies...")
     
-    required_packages = [
-        "streamlit",
-        "spacy", 
-        "pandas",
-        "openai",
-        "anthropic",
-        "PyPDF2",
-        "python-docx",
-        "pdfplumber"
-    ]
+    # Map pip distribution names to their importable module names
+    required_packages = {
+        "streamlit": "streamlit",
+        "spacy": "spacy",
+        "pandas": "pandas",
+        "openai": "openai",
+        "anthropic": "anthropic",
+        "PyPDF2": "PyPDF2",
+        "python-docx": "docx",
+        "pdfplumber": "pdfplumber"
+    }
     
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package.replace("-", "_"))
-        except ImportError:
+    # find_spec only locates the package; it doesn't execute its import-time code
+    for package, module_name in required_packages.items():
+        if importlib.util.find_spec(module_name) is None:
             missing_packages.append(package)
     
     if missing_packages:
@@ -63,11 +64,8 @@ def check_dependencies():
         print("Run: pip install -r requirements.txt")
         return False
     
-    # Check spaCy model
-    try:
-        import spacy
-        spacy.load("en_core_web_sm")
-    except OSError:
+    # Check spaCy model (installed as its own package)
+    if importlib.util.find_spec("en_core_web_sm") is None:
         print("❌ spaCy English model not found")
         print("Run: python -m spacy download en_core_web_sm")
         return False
@@ -79,11 +77,11 @@ def check_api_keys():
     """Check if API keys are configured"""
     print("🔑 Checking API configuration...")
     
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    openai_key = os.getenv("OPENAI_API_KEY")
-    anthropic_key = os.getenv("ANTHROPIC_API_KEY")
+    # Read the keys the app itself will use; config parses .env on import, so
+    # this runs after check_environment has had a chance to create it
+    from config import OPENAI_API_KEY, ANTHROPIC_API_KEY
+    openai_key = OPENAI_API_KEY
+    anthropic_key = ANTHROPIC_API_KEY
     
     if not openai_key and not anthropic_key:
         print("⚠️  No API keys found in .env file")
@@ -107,21 +105,28 @@ def launch_app():
         os.environ["STREAMLIT_SERVER_HEADLESS"] = "true"
         os.environ["STREAMLIT_SERVER_PORT"] = "8501"
         
-        # Launch Streamlit
-        subprocess.run([
+        command = [
             sys.executable, "-m", "streamlit", "run", "app.py",
             "--server.headless", "true",
             "--server.port", "8501",
             "--server.address", "localhost"
-        ])
+        ]
+        
+        # Windows has no real exec (os.execvp detaches a new process), so wait
+        # on Streamlit there; elsewhere replace this process and let Streamlit
+        # handle Ctrl+C itself
+        if os.name == "nt":
+            subprocess.run(command)
+            return True
+        sys.stdout.flush()
+        os.execvp(sys.executable, command)
         
     except KeyboardInterrupt:
         print("\n👋 Application stopped by user")
+        return True
     except Exception as e:
         print(f"❌ Error launching application: {e}")
         return False
-    
-    return True
 
 def show_startup_info():
     """Show startup information"""
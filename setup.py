@@ -1,6 +1,7 @@
 """
 Setup script for Legal Contract Assistant
 """
+import importlib.util
 import subprocess
 import sys
 import os
@@ -60,27 +61,21 @@ def verify_installation():
     """Verify installation"""
     print("\nVerifying installation...")
     
-    try:
-        # Test imports
-        import streamlit
-        import spacy
-        import pandas
-        import openai
-        import anthropic
-        
-        # Test spaCy model
-        nlp = spacy.load("en_core_web_sm")
-        
-        print("✅ All core dependencies are working")
-        return True
-        
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
+    # find_spec locates each package without running its import-time code;
+    # the spaCy model is a package of its own, so it needn't be loaded either
+    missing_packages = [module_name for module_name in ("streamlit", "spacy", "pandas", "openai", "anthropic")
+                        if importlib.util.find_spec(module_name) is None]
+    if missing_packages:
+        print(f"❌ Import error: missing {', '.join(missing_packages)}")
         return False
-    except OSError as e:
-        print(f"❌ spaCy model error: {e}")
+    
+    if importlib.util.find_spec("en_core_web_sm") is None:
+        print("❌ spaCy model error: en_core_web_sm is not installed")
         print("Please run: python -m spacy download en_core_web_sm")
         return False
+    
+    print("✅ All core dependencies are installed")
+    return True
 
 def main():
     """Main setup function"""
@@ -25,11 +25,22 @@ def main():
     print("🛑 Press Ctrl+C to stop")
     print()
     
-    # Launch Streamlit directly
+    command = [sys.executable, "-m", "streamlit", "run", "app.py"]
+    
     try:
-        subprocess.run([sys.executable, "-m", "streamlit", "run", "app.py"])
+        # Windows has no real exec, so wait on Streamlit there; elsewhere
+        # replace this process with Streamlit directly
+        if os.name == "nt":
+            subprocess.run(command)
+            return 0
+        sys.stdout.flush()
+        os.execvp(sys.executable, command)
     except KeyboardInterrupt:
         print("\n👋 Application stopped")
+        return 0
+    except Exception as e:
+        print(f"\n❌ Error launching application: {e}")
+        return 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -2,32 +2,131 @@
 Document Processing Module
 Handles extraction of text from various document formats
 """
-import PyPDF2
-import pdfplumber
-from docx import Document
+import codecs
 import hashlib
+import io
 import logging
-from typing import Dict, Optional, Tuple
+import mmap
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 import os
 
 logger = logging.getLogger(__name__)
 
+# Read size for document hashing; large reads keep the loop in C
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# With parallel extraction enabled, PDFs with at least this many pages are
+# split across worker processes on multi-core machines. Workers are spawned
+# rather than forked, since forking a threaded server can deadlock on locks
+# held at fork time; each spawned worker takes about 0.2s to start and parse
+# the PDF, against roughly 0.14s per dense text page extracted serially
+PARALLEL_PDF_MIN_PAGES = 24
+PDF_PAGES_PER_TASK = 4
+
+# Scanned PDFs have no text layer; when this many leading pages yield no text,
+# the remaining pages skip pdfplumber's layout analysis and go to PyPDF2
+PDF_TEXT_PROBE_PAGES = 3
+
+# Whitespace-delimited words, counted without building a token list
+WORD_PATTERN = re.compile(r"\S+")
+
+# Metadata extraction patterns, compiled once; each category is a single
+# alternation so the text is scanned once per category
+PARTY_PATTERN = re.compile(
+    r"between\s+(?P<first_party>[A-Z][A-Za-z\s&.,]+?)\s+and\s+(?P<second_party>[A-Z][A-Za-z\s&.,]+?)(?:\s|,|\.|;)"
+    r"|party of the first part[:\s]+(?P<first_part>[A-Z][A-Za-z\s&.,]+?)(?:\s|,|\.|;)"
+    r"|party of the second part[:\s]+(?P<second_part>[A-Z][A-Za-z\s&.,]+?)(?:\s|,|\.|;)",
+    re.IGNORECASE
+)
+DATE_PATTERN = re.compile(
+    r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}"
+    r"|\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{2,4}",
+    re.IGNORECASE
+)
+MONEY_PATTERN = re.compile(
+    r"₹\s*[\d,]+(?:\.\d{2})?"
+    r"|Rs\.?\s*[\d,]+(?:\.\d{2})?"
+    r"|rupees?\s+[\d,]+"
+    r"|\$\s*[\d,]+(?:\.\d{2})?",
+    re.IGNORECASE
+)
+KEY_TERM_PATTERN = re.compile(
+    r"term(?:s)?\s*:?\s*(?P<term>\d+\s+(?:days?|weeks?|months?|years?))"
+    r"|duration\s*:?\s*(?P<duration>\d+\s+(?:days?|weeks?|months?|years?))"
+    r"|notice\s+period\s*:?\s*(?P<notice_period>\d+\s+(?:days?|weeks?|months?))",
+    re.IGNORECASE
+)
+
+# Text clean-up for analysis preprocessing: page markers and lines holding only
+# a page number are dropped, other whitespace runs collapse to one space
+LAYOUT_NOISE_PATTERN = re.compile(
+    r"(?P<page_marker>Page\s+\d+\s+of\s+\d+)"
+    r"|(?P<number_line>^\d+[^\S\n]*$)"
+    r"|(?P<whitespace>\s+)",
+    re.IGNORECASE | re.MULTILINE
+)
+# Common legal abbreviations and their expansions
+ABBREVIATION_PATTERNS = [(re.compile(abbrev, re.IGNORECASE), full_form) for abbrev, full_form in (
+    (r'\bvs?\.\b', 'versus'),
+    (r'\betc\.\b', 'etcetera'),
+    (r'\bi\.e\.\b', 'that is'),
+    (r'\be\.g\.\b', 'for example'),
+    (r'\bw\.r\.t\.\b', 'with respect to')
+)]
+
+def _extract_page_text(page) -> Optional[str]:
+    """Extract a pdfplumber page's text, then drop the layout objects it cached"""
+    try:
+        return page.extract_text()
+    finally:
+        # Parsed characters and layout stay cached on the page for the life
+        # of the document; on long PDFs they dwarf the extracted text
+        page.flush_cache()
+
+# Per-worker-process PDF handle for parallel page extraction
+_worker_pdf = None
+
+def _open_worker_pdf(pdf_bytes: bytes) -> None:
+    """Process-pool initializer: parse the PDF once per worker"""
+    global _worker_pdf
+    import pdfplumber
+    _worker_pdf = pdfplumber.open(io.BytesIO(pdf_bytes))
+
+def _extract_worker_page(page_index: int) -> Optional[str]:
+    """Extract one page's text in a worker process"""
+    return _extract_page_text(_worker_pdf.pages[page_index])
+
 class DocumentProcessor:
     """Processes various document formats for contract analysis"""
     
-    def __init__(self, max_file_size_mb: int = 10):
-        """Initialize document processor"""
+    def __init__(self, max_file_size_mb: int = 10, parallel_pdf_pages: bool = False):
+        """Initialize document processor
+        
+        parallel_pdf_pages opts batch callers into spreading long PDFs across
+        worker processes; their entry script must be import-safe (guarded by
+        if __name__ == "__main__"), since spawned workers re-import it.
+        """
         self.max_file_size_bytes = max_file_size_mb * 1024 * 1024
+        self.parallel_pdf_pages = parallel_pdf_pages
         self.supported_formats = ['.pdf', '.docx', '.txt']
 
     def validate_file(self, file_path: str) -> Tuple[bool, str]:
         """Validate file format and size"""
-        if not os.path.exists(file_path):
+        # A single stat both checks existence and gets the size
+        try:
+            file_size = os.path.getsize(file_path)
+        except OSError:
             return False, "File does not exist"
         
+        return self.validate_upload(file_path, file_size)
+
+    def validate_upload(self, file_path: str, file_size: int) -> Tuple[bool, str]:
+        """Validate format and size for a file whose size is already known"""
         # Check file size
-        file_size = os.path.getsize(file_path)
         if file_size > self.max_file_size_bytes:
             return False, f"File size ({file_size/1024/1024:.1f}MB) exceeds maximum allowed size"
         
@@ -38,56 +137,92 @@ class DocumentProcessor:
         
         return True, "File validation passed"
 
-    def extract_text_from_pdf(self, file_path: str) -> Tuple[str, Dict]:
-        """Extract text from PDF file"""
+    def extract_text_from_pdf(self, file_path: Union[str, BinaryIO]) -> Tuple[str, Dict]:
+        """Extract text from PDF file (path or seekable binary file object)"""
         text = ""
         metadata = {"pages": 0, "extraction_method": ""}
         
         try:
             # Try pdfplumber first (better for complex layouts)
+            import pdfplumber
+            if hasattr(file_path, 'seek'):
+                file_path.seek(0)
             with pdfplumber.open(file_path) as pdf:
-                pages_text = []
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        pages_text.append(page_text)
+                page_count = len(pdf.pages)
+                extracted = [_extract_page_text(page) for page in pdf.pages[:PDF_TEXT_PROBE_PAGES]]
+                workers = self._pdf_worker_count(page_count)
+                if not any(extracted):
+                    logger.info("No text in the first %d pages, trying PyPDF2", len(extracted))
+                elif workers > 1:
+                    extracted += self._extract_pdf_pages_parallel(file_path, page_count, len(extracted), workers)
+                else:
+                    extracted += [_extract_page_text(page) for page in pdf.pages[len(extracted):]]
+                pages_text = [page_text for page_text in extracted if page_text]
                 
                 if pages_text:
                     text = "\n\n".join(pages_text)
                     metadata["pages"] = len(pages_text)
                     metadata["extraction_method"] = "pdfplumber"
-                    logger.info(f"Extracted text from {len(pages_text)} pages using pdfplumber")
+                    logger.info("Extracted text from %d pages using pdfplumber", len(pages_text))
                     return text, metadata
         
         except Exception as e:
-            logger.warning(f"pdfplumber extraction failed: {str(e)}, trying PyPDF2")
+            logger.warning("pdfplumber extraction failed: %s, trying PyPDF2", e)
         
         try:
             # Fallback to PyPDF2
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                pages_text = []
-                
-                for page_num in range(len(pdf_reader.pages)):
-                    page = pdf_reader.pages[page_num]
-                    page_text = page.extract_text()
-                    if page_text:
-                        pages_text.append(page_text)
-                
-                text = "\n\n".join(pages_text)
-                metadata["pages"] = len(pages_text)
-                metadata["extraction_method"] = "PyPDF2"
-                logger.info(f"Extracted text from {len(pages_text)} pages using PyPDF2")
+            import PyPDF2
+            if hasattr(file_path, 'seek'):
+                file_path.seek(0)
+            pdf_reader = PyPDF2.PdfReader(file_path)
+            # Iterate the pages directly rather than indexing into the page tree
+            pages_text = [page_text for page_text in (page.extract_text() for page in pdf_reader.pages)
+                          if page_text]
+            
+            text = "\n\n".join(pages_text)
+            metadata["pages"] = len(pages_text)
+            metadata["extraction_method"] = "PyPDF2"
+            logger.info("Extracted text from %d pages using PyPDF2", len(pages_text))
         
         except Exception as e:
-            logger.error(f"PDF extraction failed with both methods: {str(e)}")
+            logger.error("PDF extraction failed with both methods: %s", e)
             raise Exception(f"Failed to extract text from PDF: {str(e)}")
         
         return text, metadata
 
-    def extract_text_from_docx(self, file_path: str) -> Tuple[str, Dict]:
-        """Extract text from DOCX file"""
+    def _pdf_worker_count(self, page_count: int) -> int:
+        """Worker processes to extract a PDF with; 1 means extract it serially"""
+        if not self.parallel_pdf_pages or page_count < PARALLEL_PDF_MIN_PAGES:
+            return 1
+        return min(os.cpu_count() or 1, page_count)
+
+    @staticmethod
+    def _extract_pdf_pages_parallel(file_path: Union[str, BinaryIO], page_count: int,
+                                    first_page: int, workers: int) -> List[Optional[str]]:
+        """Extract texts of pages first_page onwards across a process pool, in page order"""
+        if hasattr(file_path, 'read'):
+            file_path.seek(0)
+            pdf_bytes = file_path.read()
+        else:
+            with open(file_path, 'rb') as f:
+                pdf_bytes = f.read()
+        
+        # pdfplumber objects can't be pickled, so each worker parses its own copy
+        workers = min(workers, page_count - first_page)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_open_worker_pdf, initargs=(pdf_bytes,)) as executor:
+            return list(executor.map(_extract_worker_page, range(first_page, page_count),
+                                     chunksize=PDF_PAGES_PER_TASK))
+
+    def extract_text_from_docx(self, file_path: Union[str, BinaryIO]) -> Tuple[str, Dict]:
+        """Extract text from DOCX file (path or seekable binary file object)"""
         try:
+            if isinstance(file_path, mmap.mmap):
+                # zipfile wants a full io object (seekable() etc.), which mmap isn't
+                file_path = io.BytesIO(file_path)
+            elif hasattr(file_path, 'seek'):
+                file_path.seek(0)
+            from docx import Document
             doc = Document(file_path)
             paragraphs = []
             
@@ -102,30 +237,43 @@ class DocumentProcessor:
                 "extraction_method": "python-docx"
             }
             
-            logger.info(f"Extracted text from DOCX with {len(paragraphs)} paragraphs")
+            logger.info("Extracted text from DOCX with %d paragraphs", len(paragraphs))
             return text, metadata
         
         except Exception as e:
-            logger.error(f"DOCX extraction failed: {str(e)}")
+            logger.error("DOCX extraction failed: %s", e)
             raise Exception(f"Failed to extract text from DOCX: {str(e)}")
 
-    def extract_text_from_txt(self, file_path: str) -> Tuple[str, Dict]:
-        """Extract text from TXT file"""
+    def extract_text_from_txt(self, file_path: Union[str, BinaryIO]) -> Tuple[str, Dict]:
+        """Extract text from TXT file (path or seekable binary file object)"""
         try:
-            # Try different encodings
-            encodings = ['utf-8', 'utf-16', 'latin-1', 'cp1252']
+            if hasattr(file_path, 'read'):
+                file_path.seek(0)
+                raw = file_path.read()
+            else:
+                with open(file_path, 'rb') as file:
+                    raw = file.read()
+            
+            # A byte-order mark settles the encoding; otherwise try strict
+            # decoders before latin-1, which accepts any byte sequence
+            if raw.startswith(codecs.BOM_UTF8):
+                encodings = ['utf-8-sig']
+            elif raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+                encodings = ['utf-16']
+            else:
+                encodings = ['utf-8', 'cp1252', 'latin-1']
             
             for encoding in encodings:
                 try:
-                    with open(file_path, 'r', encoding=encoding) as file:
-                        text = file.read()
+                    # Decode with universal newlines, as text-mode open() would
+                    text = raw.decode(encoding).replace('\r\n', '\n').replace('\r', '\n')
                     
                     metadata = {
                         "encoding": encoding,
                         "extraction_method": "text_file"
                     }
                     
-                    logger.info(f"Extracted text from TXT file using {encoding} encoding")
+                    logger.info("Extracted text from TXT file using %s encoding", encoding)
                     return text, metadata
                 
                 except UnicodeDecodeError:
@@ -134,33 +282,84 @@ class DocumentProcessor:
             raise Exception("Could not decode text file with any supported encoding")
         
         except Exception as e:
-            logger.error(f"TXT extraction failed: {str(e)}")
+            logger.error("TXT extraction failed: %s", e)
             raise Exception(f"Failed to extract text from TXT: {str(e)}")
 
     def process_document(self, file_path: str) -> Dict:
         """Main document processing function"""
-        logger.info(f"Processing document: {file_path}")
+        logger.info("Processing document: %s", file_path)
+        
+        try:
+            f = open(file_path, 'rb')
+        except OSError:
+            raise ValueError("File does not exist")
+        
+        with f:
+            # Validate file, sizing it through the open handle rather than a
+            # separate stat of the path
+            file_size = os.fstat(f.fileno()).st_size
+            is_valid, validation_message = self.validate_upload(file_path, file_size)
+            if not is_valid:
+                raise ValueError(validation_message)
+            
+            # Map the file instead of copying it into memory: the hash reads the
+            # page cache directly and the extractors use the map as a seekable
+            # file object (an empty file can't be mapped, and has no text anyway)
+            if file_size:
+                document = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                document = io.BytesIO()
+        
+        with document:
+            # Generate document hash for audit trail
+            doc_hash = self.generate_document_hash(document)
+            
+            # Extract text based on file type
+            _, ext = os.path.splitext(file_path.lower())
+            text, extraction_metadata = self._extract_text(document, ext)
         
-        # Validate file
-        is_valid, validation_message = self.validate_file(file_path)
+        return self._build_result(file_path, file_size, ext, doc_hash, text, extraction_metadata)
+
+    def process_document_stream(self, stream: BinaryIO, file_name: str,
+                                doc_hash: Optional[str] = None) -> Dict:
+        """Process an uploaded document from a seekable binary stream
+        
+        Lets callers keep small uploads in memory (e.g. a SpooledTemporaryFile)
+        instead of writing every upload to a named file on disk. Callers that
+        already hashed the content can pass doc_hash to skip a second pass.
+        """
+        logger.info("Processing uploaded document: %s", file_name)
+        
+        # Validate upload
+        file_size = stream.seek(0, os.SEEK_END)
+        is_valid, validation_message = self.validate_upload(file_name, file_size)
         if not is_valid:
             raise ValueError(validation_message)
         
         # Generate document hash for audit trail
-        doc_hash = self.generate_document_hash(file_path)
+        if doc_hash is None:
+            doc_hash = self.generate_document_hash(stream)
         
         # Extract text based on file type
-        _, ext = os.path.splitext(file_path.lower())
+        _, ext = os.path.splitext(file_name.lower())
+        text, extraction_metadata = self._extract_text(stream, ext)
         
+        return self._build_result(file_name, file_size, ext, doc_hash, text, extraction_metadata)
+
+    def _extract_text(self, source: Union[str, BinaryIO], ext: str) -> Tuple[str, Dict]:
+        """Dispatch text extraction on file extension"""
         if ext == '.pdf':
-            text, extraction_metadata = self.extract_text_from_pdf(file_path)
+            return self.extract_text_from_pdf(source)
         elif ext == '.docx':
-            text, extraction_metadata = self.extract_text_from_docx(file_path)
+            return self.extract_text_from_docx(source)
         elif ext == '.txt':
-            text, extraction_metadata = self.extract_text_from_txt(file_path)
+            return self.extract_text_from_txt(source)
         else:
             raise ValueError(f"Unsupported file format: {ext}")
-        
+
+    def _build_result(self, file_path: str, file_size: int, ext: str, doc_hash: str,
+                      text: str, extraction_metadata: Dict) -> Dict:
+        """Validate extracted text and assemble the processing result"""
         # Validate extracted text
         if not text or len(text.strip()) < 100:
             raise ValueError("Insufficient text extracted from document. Please ensure the document contains readable text.")
@@ -169,116 +368,94 @@ class DocumentProcessor:
         result = {
             "file_path": file_path,
             "file_name": os.path.basename(file_path),
-            "file_size_bytes": os.path.getsize(file_path),
+            "file_size_bytes": file_size,
             "file_type": ext,
             "document_hash": doc_hash,
             "extracted_text": text,
             "text_length": len(text),
-            "word_count": len(text.split()),
+            "word_count": sum(1 for _ in WORD_PATTERN.finditer(text)),
             "extraction_metadata": extraction_metadata,
             "processed_at": datetime.now().isoformat()
         }
         
-        logger.info(f"Document processing completed. Text length: {len(text)} characters")
+        logger.info("Document processing completed. Text length: %d characters", len(text))
         return result
 
-    def generate_document_hash(self, file_path: str) -> str:
+    def generate_document_hash(self, file_path: Union[str, BinaryIO]) -> str:
         """Generate SHA-256 hash of document for audit trail"""
         try:
-            hash_sha256 = hashlib.sha256()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
+            if hasattr(file_path, 'read'):
+                file_path.seek(0)
+                hash_sha256 = self._sha256_digest(file_path)
+                file_path.seek(0)
+            else:
+                # Unbuffered, so the OS copies straight into the read buffer
+                with open(file_path, "rb", buffering=0) as f:
+                    hash_sha256 = self._sha256_digest(f)
             return hash_sha256.hexdigest()
         except Exception as e:
-            logger.error(f"Failed to generate document hash: {str(e)}")
+            logger.error("Failed to generate document hash: %s", e)
             return "hash_generation_failed"
 
+    @staticmethod
+    def _sha256_digest(file_obj: BinaryIO):
+        """SHA-256 a binary file object positioned at its start"""
+        if isinstance(file_obj, mmap.mmap):
+            # Already a contiguous buffer: hash it in one call, without copying
+            return hashlib.sha256(file_obj)
+        
+        if hasattr(hashlib, 'file_digest'):
+            # Python 3.11+: the whole read/update loop runs in C
+            try:
+                return hashlib.file_digest(file_obj, "sha256")
+            except ValueError:
+                pass  # not a readable binary file object; hash it below
+        
+        hash_obj = hashlib.sha256()
+        readinto = getattr(file_obj, 'readinto', None)
+        if readinto is None:
+            # e.g. SpooledTemporaryFile before Python 3.11
+            for chunk in iter(lambda: file_obj.read(HASH_CHUNK_BYTES), b""):
+                hash_obj.update(chunk)
+            return hash_obj
+        
+        buffer = bytearray(HASH_CHUNK_BYTES)
+        view = memoryview(buffer)
+        while True:
+            size = readinto(buffer)
+            if not size:
+                break
+            hash_obj.update(view[:size])
+        return hash_obj
+
     def extract_document_metadata(self, text: str) -> Dict:
         """Extract basic metadata from document text"""
-        import re
+        # Captures are already trimmed, so duplicates can be dropped as they are
+        # collected; dict.fromkeys keeps first-occurrence order
+        parties = (party.strip() for match in PARTY_PATTERN.finditer(text)
+                   for party in match.groups() if party)
+        key_terms = (match.group(match.lastgroup) for match in KEY_TERM_PATTERN.finditer(text))
         
         metadata = {
-            "parties": [],
-            "dates": [],
-            "monetary_amounts": [],
-            "key_terms": []
+            # Potential party names (basic pattern matching)
+            "parties": list(dict.fromkeys(party for party in parties if party)),
+            "dates": list(dict.fromkeys(DATE_PATTERN.findall(text))),
+            "monetary_amounts": list(dict.fromkeys(MONEY_PATTERN.findall(text))),
+            # Key terms (basic)
+            "key_terms": list(dict.fromkeys(key_terms))
         }
         
-        # Extract potential party names (basic pattern matching)
-        party_patterns = [
-            r"between\s+([A-Z][A-Za-z\s&.,]+?)\s+and\s+([A-Z][A-Za-z\s&.,]+?)(?:\s|,|\.|;)",
-            r"party of the first part[:\s]+([A-Z][A-Za-z\s&.,]+?)(?:\s|,|\.|;)",
-            r"party of the second part[:\s]+([A-Z][A-Za-z\s&.,]+?)(?:\s|,|\.|;)"
-        ]
-        
-        for pattern in party_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    metadata["parties"].extend([m.strip() for m in match if m.strip()])
-                else:
-                    metadata["parties"].append(match.strip())
-        
-        # Extract dates
-        date_patterns = [
-            r"\d{1,2}[/-]\d{1,2}[/-]\d{2,4}",
-            r"\d{1,2}\s+(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{2,4}"
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            metadata["dates"].extend(matches)
-        
-        # Extract monetary amounts
-        money_patterns = [
-            r"₹\s*[\d,]+(?:\.\d{2})?",
-            r"Rs\.?\s*[\d,]+(?:\.\d{2})?",
-            r"rupees?\s+[\d,]+",
-            r"\$\s*[\d,]+(?:\.\d{2})?"
-        ]
-        
-        for pattern in money_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            metadata["monetary_amounts"].extend(matches)
-        
-        # Extract key terms (basic)
-        key_term_patterns = [
-            r"term(?:s)?\s*:?\s*(\d+\s+(?:days?|weeks?|months?|years?))",
-            r"duration\s*:?\s*(\d+\s+(?:days?|weeks?|months?|years?))",
-            r"notice\s+period\s*:?\s*(\d+\s+(?:days?|weeks?|months?))"
-        ]
-        
-        for pattern in key_term_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            metadata["key_terms"].extend(matches)
-        
-        # Remove duplicates and clean up
-        for key in metadata:
-            if isinstance(metadata[key], list):
-                metadata[key] = list(set([item.strip() for item in metadata[key] if item.strip()]))
-        
         return metadata
 
     def preprocess_text_for_analysis(self, text: str) -> str:
         """Preprocess extracted text for better analysis"""
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove page numbers and headers/footers (basic patterns)
-        text = re.sub(r'Page\s+\d+\s+of\s+\d+', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'^\d+\s*$', '', text, flags=re.MULTILINE)
+        # Remove page numbers and excessive whitespace in a single pass
+        text = LAYOUT_NOISE_PATTERN.sub(
+            lambda match: ' ' if match.lastgroup == 'whitespace' else '', text
+        )
         
         # Normalize common legal abbreviations
-        abbreviations = {
-            r'\bvs?\.\b': 'versus',
-            r'\betc\.\b': 'etcetera',
-            r'\bi\.e\.\b': 'that is',
-            r'\be\.g\.\b': 'for example',
-            r'\bw\.r\.t\.\b': 'with respect to'
-        }
-        
-        for abbrev, full_form in abbreviations.items():
-            text = re.sub(abbrev, full_form, text, flags=re.IGNORECASE)
+        for abbrev, full_form in ABBREVIATION_PATTERNS:
+            text = abbrev.sub(full_form, text)
         
-        return text.strip()
\ No newline at end of file
+        return text.strip()
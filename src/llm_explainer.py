@@ -3,16 +3,81 @@ LLM-powered Plain Language Explanation Generator
 Converts complex legal clauses into business-friendly explanations
 Uses Google Gemini API (free), with OpenAI and Anthropic as fallbacks
 """
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional
-from config import GEMINI_API_KEY, OPENAI_API_KEY, ANTHROPIC_API_KEY, DEFAULT_LLM_MODEL
+import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from config import (GEMINI_API_KEY, OPENAI_API_KEY, ANTHROPIC_API_KEY, DEFAULT_LLM_MODEL,
+                    LLM_CACHE_MAX_ENTRIES, LLM_CACHE_PATH, LLM_CONCURRENCY)
 
 logger = logging.getLogger(__name__)
 
+# parse_clause_explanation's section keys, with the numbered headings the
+# clause prompt asks the model to use
+CLAUSE_EXPLANATION_SECTIONS = (
+    ("simple_explanation", "1. SIMPLE EXPLANATION"),
+    ("who_benefits", "2. WHO BENEFITS"),
+    ("business_impact", "3. BUSINESS IMPACT"),
+    ("watch_out_for", "4. WATCH OUT FOR"),
+    ("assessment", "5. STANDARD/AGGRESSIVE")
+)
+
+# Section headings as the model actually writes them: optionally numbered and
+# markdown-decorated ("**2. Who Benefits:**"), alone on their line or followed
+# by a colon. Each group is named after the section key it starts.
+_HEADING_PREFIX = r"^[ \t]*(?:#+[ \t]*)?(?:\*\*)?(?:\d+[.)][ \t]*)?(?:\*\*)?"
+_HEADING_SUFFIX = r"[ \t]*(?:\*\*)?[ \t]*(?::|\?|$)(?:\*\*)?"
+
+CLAUSE_SECTION_PATTERN = re.compile(
+    _HEADING_PREFIX +
+    r"(?:(?P<simple_explanation>SIMPLE EXPLANATION)"
+    r"|(?P<who_benefits>WHO BENEFITS(?: FROM THIS CLAUSE)?)"
+    r"|(?P<business_impact>BUSINESS IMPACT)"
+    r"|(?P<watch_out_for>WATCH OUT(?: FOR)?)"
+    r"|(?P<assessment>STANDARD(?:[ \t]*(?:/|OR)[ \t]*AGGRESSIVE)?))" +
+    _HEADING_SUFFIX,
+    re.IGNORECASE | re.MULTILINE
+)
+
+NEGOTIATION_SECTION_PATTERN = re.compile(
+    _HEADING_PREFIX +
+    r"(?:(?P<alternative_wording>ALTERNATIVE WORDING)"
+    r"|(?P<compromise_positions>COMPROMISE(?: POSITIONS)?)"
+    r"|(?P<questions_to_ask>QUESTIONS(?: TO ASK)?)"
+    r"|(?P<fallback_options>FALLBACK(?: OPTIONS| POSITIONS)?)"
+    r"|(?P<deal_breakers>DEAL[ -]?BREAKERS?))" +
+    _HEADING_SUFFIX,
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+def _split_sections(chunks: Iterable[str], pattern, first_key: str) -> Iterator[Tuple[str, List[str]]]:
+    """Yield (section key, non-empty body lines) for each section of a chunked text, as soon as it ends"""
+    buffer, key, position, scanned = "", first_key, 0, 0
+    for chunk in chunks:
+        buffer += chunk
+        # Headings are only looked for in complete lines, each scanned once
+        complete = buffer.rfind("\n") + 1
+        for match in pattern.finditer(buffer, scanned, complete):
+            yield key, [line.strip() for line in buffer[position:match.start()].splitlines() if line.strip()]
+            key, position = match.lastgroup, match.end()
+        scanned = max(complete, position)
+    
+    for match in pattern.finditer(buffer, scanned):
+        yield key, [line.strip() for line in buffer[position:match.start()].splitlines() if line.strip()]
+        key, position = match.lastgroup, match.end()
+    yield key, [line.strip() for line in buffer[position:].splitlines() if line.strip()]
+
+
 class LegalExplainer:
     """Generates plain-language explanations of legal clauses using Gemini AI"""
     
-    def __init__(self, model: str = DEFAULT_LLM_MODEL):
+    def __init__(self, model: str = DEFAULT_LLM_MODEL, cache_path: Optional[str] = LLM_CACHE_PATH):
         """Initialize the LLM explainer with Gemini as primary"""
         self.model = model
         
@@ -29,7 +94,7 @@ class LegalExplainer:
                 self.gemini_client = genai.GenerativeModel('gemini-2.5-flash')
                 logger.info("✅ Gemini AI client initialized successfully")
             except Exception as e:
-                logger.warning(f"Failed to initialize Gemini client: {str(e)}")
+                logger.warning("Failed to initialize Gemini client: %s", e)
         
         # OpenAI as fallback
         if OPENAI_API_KEY and OPENAI_API_KEY != "your_openai_api_key_here":
@@ -38,7 +103,7 @@ class LegalExplainer:
                 self.openai_client = openai.OpenAI(api_key=OPENAI_API_KEY)
                 logger.info("✅ OpenAI client initialized successfully")
             except Exception as e:
-                logger.warning(f"Failed to initialize OpenAI client: {str(e)}")
+                logger.warning("Failed to initialize OpenAI client: %s", e)
         
         # Anthropic as second fallback
         if ANTHROPIC_API_KEY and ANTHROPIC_API_KEY != "your_anthropic_api_key_here":
@@ -47,11 +112,21 @@ class LegalExplainer:
                 self.anthropic_client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
                 logger.info("✅ Anthropic client initialized successfully")
             except Exception as e:
-                logger.warning(f"Failed to initialize Anthropic client: {str(e)}")
+                logger.warning("Failed to initialize Anthropic client: %s", e)
         
-        if not any([self.gemini_client, self.openai_client, self.anthropic_client]):
+        if not self.llm_available:
             logger.info("No LLM clients available. Using fallback explanations.")
         
+        # Resolve the provider once rather than re-checking clients on every call
+        self._provider_request, self._provider_stream = self._select_provider()
+        
+        # LRU cache of model responses keyed by prompt digest; the explainer is
+        # shared across sessions, so repeat clicks on a clause skip the API call
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        # Optional on-disk tier behind the in-memory cache, shared across restarts
+        self._response_store = self._open_response_store(cache_path) if cache_path else None
+        
         # System prompts for different explanation types
         self.system_prompts = {
             "clause_explanation": """You are a business mentor helping small business owners in India understand contract clauses. 
@@ -109,47 +184,234 @@ Provide:
 Always prefix with: "Suggested negotiation language — not legal advice. Have any changes reviewed by a lawyer before agreeing."
 """
         }
+        
+        # Work that depends only on the system prompt, done once: Gemini takes a
+        # single prompt string, so its system-prompt prefix is assembled here,
+        # and cache-key digests start from a copy already fed model and prompt
+        self._gemini_prompt_prefixes = {}
+        self._cache_key_seeds = {}
+        for system_prompt in self.system_prompts.values():
+            self._gemini_prompt_prefixes[system_prompt] = f"{system_prompt}\n\nUser Request: "
+            self._cache_key_seeds[system_prompt] = self._seed_cache_key(system_prompt)
 
-    def _call_llm(self, prompt: str, system_prompt: str) -> str:
-        """Make LLM API call - tries Gemini first, then OpenAI, then Anthropic"""
+    @property
+    def llm_available(self) -> bool:
+        """Whether any LLM client was initialized"""
+        return any([self.gemini_client, self.openai_client, self.anthropic_client])
+
+    def _seed_cache_key(self, system_prompt: str):
+        """Cache-key digest fed everything but the user prompt"""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (self.model, system_prompt):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest
+
+    def _response_cache_key(self, prompt: str, system_prompt: str) -> str:
+        """Digest identifying a prompt for a given model"""
+        seed = self._cache_key_seeds.get(system_prompt)
+        digest = seed.copy() if seed is not None else self._seed_cache_key(system_prompt)
+        digest.update(prompt.encode('utf-8'))
+        digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _gemini_prompt(self, prompt: str, system_prompt: str) -> str:
+        """Gemini's single prompt string: the system prompt, then the user request"""
+        prefix = self._gemini_prompt_prefixes.get(system_prompt)
+        if prefix is None:
+            prefix = f"{system_prompt}\n\nUser Request: "
+        return prefix + prompt
+
+    @staticmethod
+    def _open_response_store(cache_path: str) -> Optional[sqlite3.Connection]:
+        """Open (creating if needed) the SQLite response store"""
         try:
-            # Try Gemini first (free and reliable)
-            if self.gemini_client:
-                full_prompt = f"{system_prompt}\n\nUser Request: {prompt}"
-                response = self.gemini_client.generate_content(full_prompt)
-                return response.text
-            
-            # Fallback to OpenAI
-            elif self.model.startswith("gpt") and self.openai_client:
-                response = self.openai_client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=1000,
-                    temperature=0.3
-                )
-                return response.choices[0].message.content
-            
-            # Fallback to Anthropic
-            elif self.model.startswith("claude") and self.anthropic_client:
-                response = self.anthropic_client.messages.create(
-                    model=self.model,
-                    max_tokens=1000,
-                    temperature=0.3,
-                    system=system_prompt,
-                    messages=[{"role": "user", "content": prompt}]
-                )
-                return response.content[0].text
+            # Shared by the prefetch threads; every access holds the cache lock
+            store = sqlite3.connect(cache_path, check_same_thread=False)
+            store.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+            store.commit()
+            return store
+        except sqlite3.Error as e:
+            logger.warning("LLM response store unavailable at %s: %s", cache_path, e)
+            return None
+
+    def _get_cached_response(self, cache_key: str) -> Optional[str]:
+        """Return a cached response, marking it most recently used"""
+        with self._response_cache_lock:
+            response = self._response_cache.get(cache_key)
+            if response is not None:
+                self._response_cache.move_to_end(cache_key)
+                return response
             
-            else:
-                logger.error("No valid LLM client available")
-                return self._fallback_explanation()
-                
+            if self._response_store is None:
+                return None
+            try:
+                row = self._response_store.execute(
+                    "SELECT response FROM responses WHERE key = ?", (cache_key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("LLM response store read failed: %s", e)
+                return None
+            if row is None:
+                return None
+            self._remember_response(cache_key, row[0])
+            return row[0]
+
+    def _cache_response(self, cache_key: str, response: str) -> None:
+        """Store a successful response, evicting the least recently used one"""
+        with self._response_cache_lock:
+            self._remember_response(cache_key, response)
+            if self._response_store is not None:
+                try:
+                    with self._response_store:
+                        self._response_store.execute(
+                            "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                            (cache_key, response)
+                        )
+                except sqlite3.Error as e:
+                    logger.warning("LLM response store write failed: %s", e)
+
+    def _remember_response(self, cache_key: str, response: str) -> None:
+        """Put a response in the in-memory LRU; caller holds the cache lock"""
+        self._response_cache[cache_key] = response
+        self._response_cache.move_to_end(cache_key)
+        while len(self._response_cache) > LLM_CACHE_MAX_ENTRIES:
+            self._response_cache.popitem(last=False)
+
+    def _call_llm(self, prompt: str, system_prompt: str) -> str:
+        """Make LLM API call, answering repeated prompts from the response cache"""
+        cache_key = self._response_cache_key(prompt, system_prompt)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = self._request_llm(prompt, system_prompt)
         except Exception as e:
-            logger.error(f"LLM API call failed: {str(e)}")
+            logger.error("LLM API call failed: %s", e)
+            return self._fallback_explanation()
+        
+        if response is None:
             return self._fallback_explanation()
+        
+        # Only real model output is cached, never the fallback text
+        self._cache_response(cache_key, response)
+        return response
+
+    def _select_provider(self) -> Tuple[Optional[Callable], Optional[Callable]]:
+        """(request, stream) methods of the provider to use - Gemini first, then OpenAI, then Anthropic"""
+        # Try Gemini first (free and reliable)
+        if self.gemini_client:
+            return self._request_gemini, self._stream_gemini
+        # Fallback to OpenAI
+        elif self.model.startswith("gpt") and self.openai_client:
+            return self._request_openai, self._stream_openai
+        # Fallback to Anthropic
+        elif self.model.startswith("claude") and self.anthropic_client:
+            return self._request_anthropic, self._stream_anthropic
+        return None, None
+
+    def _request_llm(self, prompt: str, system_prompt: str) -> Optional[str]:
+        """Send the prompt to the provider chosen at start-up"""
+        if self._provider_request is None:
+            logger.error("No valid LLM client available")
+            return None
+        return self._provider_request(prompt, system_prompt)
+
+    def _request_gemini(self, prompt: str, system_prompt: str) -> str:
+        """Send the prompt to Gemini"""
+        response = self.gemini_client.generate_content(self._gemini_prompt(prompt, system_prompt))
+        return response.text
+
+    def _request_openai(self, prompt: str, system_prompt: str) -> str:
+        """Send the prompt to OpenAI"""
+        response = self.openai_client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1000,
+            temperature=0.3
+        )
+        return response.choices[0].message.content
+
+    def _request_anthropic(self, prompt: str, system_prompt: str) -> str:
+        """Send the prompt to Anthropic"""
+        response = self.anthropic_client.messages.create(
+            model=self.model,
+            max_tokens=1000,
+            temperature=0.3,
+            system=system_prompt,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return response.content[0].text
+
+    def _stream_llm(self, prompt: str, system_prompt: str) -> Iterator[str]:
+        """Stream an LLM response as text chunks, sharing the response cache with _call_llm"""
+        cache_key = self._response_cache_key(prompt, system_prompt)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        chunks = []
+        try:
+            for chunk in self._request_llm_stream(prompt, system_prompt):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            logger.error("LLM streaming call failed: %s", e)
+            yield self._fallback_explanation()
+            return
+        
+        if chunks:
+            self._cache_response(cache_key, "".join(chunks))
+        else:
+            yield self._fallback_explanation()
+
+    def _request_llm_stream(self, prompt: str, system_prompt: str) -> Iterator[str]:
+        """Stream the prompt's response from the provider chosen at start-up"""
+        if self._provider_stream is None:
+            logger.error("No valid LLM client available")
+            return
+        yield from self._provider_stream(prompt, system_prompt)
+
+    def _stream_gemini(self, prompt: str, system_prompt: str) -> Iterator[str]:
+        """Stream the prompt's response from Gemini"""
+        full_prompt = self._gemini_prompt(prompt, system_prompt)
+        for chunk in self.gemini_client.generate_content(full_prompt, stream=True):
+            yield chunk.text
+
+    def _stream_openai(self, prompt: str, system_prompt: str) -> Iterator[str]:
+        """Stream the prompt's response from OpenAI"""
+        stream = self.openai_client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1000,
+            temperature=0.3,
+            stream=True
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+
+    def _stream_anthropic(self, prompt: str, system_prompt: str) -> Iterator[str]:
+        """Stream the prompt's response from Anthropic"""
+        stream = self.anthropic_client.messages.create(
+            model=self.model,
+            max_tokens=1000,
+            temperature=0.3,
+            system=system_prompt,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True
+        )
+        for event in stream:
+            if event.type == "content_block_delta":
+                yield event.delta.text
 
     def _fallback_explanation(self) -> str:
         """Fallback explanation when LLM is unavailable"""
@@ -166,10 +428,11 @@ Always prefix with: "Suggested negotiation language — not legal advice. Have a
         This system cannot provide legal advice. All explanations are for educational purposes only.
         """
 
-    def explain_clause(self, clause_text: str, clause_type: str, contract_type: str) -> Dict[str, str]:
-        """Generate plain-language explanation of a contract clause"""
-        
-        prompt = f"""
+    def _clause_explanation_prompt(self, clause_text: str, clause_type: str, contract_type: str) -> str:
+        """Build the prompt for a plain-language clause explanation"""
+        # Collapse whitespace so reflowed copies of a clause share a cache entry
+        clause_text = " ".join(clause_text.split())
+        return f"""
         Contract Type: {contract_type}
         Clause Type: {clause_type}
         
@@ -186,38 +449,43 @@ Always prefix with: "Suggested negotiation language — not legal advice. Have a
         
         Keep the language simple and practical. Focus on business implications, not legal technicalities.
         """
+
+    def explain_clause(self, clause_text: str, clause_type: str, contract_type: str) -> Dict[str, str]:
+        """Generate plain-language explanation of a contract clause"""
         
+        prompt = self._clause_explanation_prompt(clause_text, clause_type, contract_type)
         explanation = self._call_llm(prompt, self.system_prompts["clause_explanation"])
+        return self.parse_clause_explanation(explanation)
+
+    def stream_clause_explanation(self, clause_text: str, clause_type: str, contract_type: str) -> Iterator[str]:
+        """Stream the raw clause explanation as it is generated
         
-        # Parse the response into structured format
-        sections = {
-            "simple_explanation": "",
-            "who_benefits": "",
-            "business_impact": "",
-            "watch_out_for": "",
-            "assessment": ""
-        }
+        Join the chunks and pass them to parse_clause_explanation for the
+        same sections explain_clause returns.
+        """
+        prompt = self._clause_explanation_prompt(clause_text, clause_type, contract_type)
+        return self._stream_llm(prompt, self.system_prompts["clause_explanation"])
+
+    def stream_clause_sections(self, clause_text: str, clause_type: str, contract_type: str) -> Iterator[Tuple[str, str]]:
+        """Yield (section key, text) for each explanation section as soon as its generation finishes
         
-        # Try to extract sections from the response
-        lines = explanation.split('\n')
-        current_section = "simple_explanation"
+        Keys are those of parse_clause_explanation; a section the response
+        repeats is yielded once per occurrence.
+        """
+        chunks = self.stream_clause_explanation(clause_text, clause_type, contract_type)
+        for key, lines in _split_sections(chunks, CLAUSE_SECTION_PATTERN, "simple_explanation"):
+            if lines:
+                yield key, " ".join(lines)
+
+    def parse_clause_explanation(self, explanation: str) -> Dict[str, str]:
+        """Split a raw clause explanation into its five sections"""
         
-        for line in lines:
-            line = line.strip()
-            if "WHO BENEFITS" in line.upper():
-                current_section = "who_benefits"
-            elif "BUSINESS IMPACT" in line.upper():
-                current_section = "business_impact"
-            elif "WATCH OUT" in line.upper():
-                current_section = "watch_out_for"
-            elif "STANDARD" in line.upper() or "AGGRESSIVE" in line.upper():
-                current_section = "assessment"
-            elif line and not line.startswith(('1.', '2.', '3.', '4.', '5.')):
-                sections[current_section] += line + " "
-        
-        # Clean up sections
-        for key in sections:
-            sections[key] = sections[key].strip()
+        # Route each heading's body to its section; text before the first
+        # heading belongs to the simple explanation
+        section_lines = {key: [] for key, _ in CLAUSE_EXPLANATION_SECTIONS}
+        for key, lines in _split_sections((explanation,), CLAUSE_SECTION_PATTERN, "simple_explanation"):
+            section_lines[key].extend(lines)
+        sections = {key: " ".join(lines) for key, lines in section_lines.items()}
         
         # If parsing failed, put everything in simple_explanation
         if not any(sections.values()):
@@ -225,6 +493,98 @@ Always prefix with: "Suggested negotiation language — not legal advice. Have a
         
         return sections
 
+    def explain_clauses(self, clauses: List, contract_type: str,
+                        max_workers: int = LLM_CONCURRENCY) -> List[Dict[str, str]]:
+        """Explain several clauses concurrently, at most max_workers requests in flight
+        
+        Responses land in the response cache, so later explain_clause or
+        stream_clause_explanation calls for these clauses return immediately.
+        Clauses already cached are answered inline without taking a worker.
+        """
+        system_prompt = self.system_prompts["clause_explanation"]
+        prompts = [
+            self._clause_explanation_prompt(clause.text, clause.clause_type, contract_type)
+            for clause in clauses
+        ]
+        explanations = [
+            self._get_cached_response(self._response_cache_key(prompt, system_prompt))
+            for prompt in prompts
+        ]
+        pending = [i for i, explanation in enumerate(explanations) if explanation is None]
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="clause-explainer") as pool:
+                responses = pool.map(lambda i: self._call_llm(prompts[i], system_prompt), pending)
+                for i, explanation in zip(pending, responses):
+                    explanations[i] = explanation
+        
+        return [self.parse_clause_explanation(explanation) for explanation in explanations]
+
+    def explain_clauses_batch(self, clauses: List, contract_type: str) -> List[Dict[str, str]]:
+        """Explain several clauses, fetching the uncached ones in a single Gemini request
+        
+        Each batched explanation is cached under its clause's explain_clause
+        prompt, so the per-clause calls that follow (and later clicks) are
+        answered from the cache. Without Gemini, or if the batched reply is
+        unusable, the clauses are explained individually.
+        """
+        system_prompt = self.system_prompts["clause_explanation"]
+        cache_keys = [
+            self._response_cache_key(
+                self._clause_explanation_prompt(clause.text, clause.clause_type, contract_type), system_prompt
+            )
+            for clause in clauses
+        ]
+        pending = [i for i, cache_key in enumerate(cache_keys) if self._get_cached_response(cache_key) is None]
+        
+        if self.gemini_client and len(pending) > 1:
+            items = self._request_clause_batch([clauses[i] for i in pending], contract_type)
+            if items is not None:
+                for i, item in zip(pending, items):
+                    self._cache_response(cache_keys[i], self._format_clause_sections(item))
+        
+        return self.explain_clauses(clauses, contract_type)
+
+    def _request_clause_batch(self, clauses: List, contract_type: str) -> Optional[List[Dict]]:
+        """Ask Gemini for every clause's explanation sections as one JSON array"""
+        clause_list = json.dumps(
+            [{"clause_type": clause.clause_type, "text": " ".join(clause.text.split())} for clause in clauses],
+            ensure_ascii=False
+        )
+        fields = ", ".join(key for key, _ in CLAUSE_EXPLANATION_SECTIONS)
+        prompt = f"""
+        Contract Type: {contract_type}
+        
+        Give a business-friendly explanation of each clause below for an Indian SME owner.
+        Return a JSON array with exactly one object per clause, in the same order. Each
+        object has these string fields: {fields}. The assessment says whether the clause
+        is standard, aggressive, or unfavorable, and why.
+        
+        Clauses:
+        {clause_list}
+        """
+        try:
+            response = self.gemini_client.generate_content(
+                self._gemini_prompt(prompt, self.system_prompts["clause_explanation"]),
+                generation_config={"response_mime_type": "application/json"}
+            )
+            items = json.loads(response.text)
+        except Exception as e:
+            logger.warning("Batched clause explanation failed: %s", e)
+            return None
+        
+        if not isinstance(items, list) or len(items) != len(clauses) or not all(isinstance(item, dict) for item in items):
+            logger.warning("Batched clause explanation did not match the clauses; explaining individually")
+            return None
+        return items
+
+    def _format_clause_sections(self, sections: Dict) -> str:
+        """Lay out explanation sections as the headed text parse_clause_explanation reads"""
+        return "\n\n".join(
+            f"{heading}\n{' '.join(str(sections.get(key) or '').split())}"
+            for key, heading in CLAUSE_EXPLANATION_SECTIONS
+        )
+
     def explain_risk(self, risk_flag, clause_text: str) -> Dict[str, str]:
         """Generate business-focused risk explanation"""
         
@@ -260,12 +620,11 @@ Always prefix with: "Suggested negotiation language — not legal advice. Have a
             "score": risk_flag.score
         }
 
-    def suggest_negotiations(self, clause_text: str, risk_flags: List, clause_type: str) -> Dict[str, List[str]]:
-        """Generate negotiation suggestions for problematic clauses"""
-        
+    def _negotiation_prompt(self, clause_text: str, risk_flags: List, clause_type: str) -> str:
+        """Build the prompt for negotiation suggestions on a clause"""
         risk_descriptions = [f"{rf.risk_type}: {rf.description}" for rf in risk_flags]
         
-        prompt = f"""
+        return f"""
         Clause Type: {clause_type}
         
         Original Clause:
@@ -284,10 +643,26 @@ Always prefix with: "Suggested negotiation language — not legal advice. Have a
         
         Consider that SMEs have limited bargaining power but need to protect their interests.
         """
+
+    def suggest_negotiations(self, clause_text: str, risk_flags: List, clause_type: str) -> Dict[str, List[str]]:
+        """Generate negotiation suggestions for problematic clauses"""
         
+        prompt = self._negotiation_prompt(clause_text, risk_flags, clause_type)
         suggestions = self._call_llm(prompt, self.system_prompts["negotiation_suggestions"])
+        return self.parse_negotiation_suggestions(suggestions)
+
+    def stream_negotiation_suggestions(self, clause_text: str, risk_flags: List, clause_type: str) -> Iterator[str]:
+        """Stream the raw negotiation suggestions as they are generated
+        
+        parse_negotiation_suggestions can be applied to the text received so
+        far, so categories can be shown as soon as they are complete.
+        """
+        prompt = self._negotiation_prompt(clause_text, risk_flags, clause_type)
+        return self._stream_llm(prompt, self.system_prompts["negotiation_suggestions"])
+
+    def parse_negotiation_suggestions(self, suggestions: str) -> Dict[str, List[str]]:
+        """Split raw negotiation suggestions into their categories"""
         
-        # Parse suggestions into categories
         suggestion_categories = {
             "alternative_wording": [],
             "compromise_positions": [],
@@ -295,25 +670,8 @@ Always prefix with: "Suggested negotiation language — not legal advice. Have a
             "fallback_options": [],
             "deal_breakers": []
         }
-        
-        # Simple parsing - in production, use more sophisticated NLP
-        lines = suggestions.split('\n')
-        current_category = "alternative_wording"
-        
-        for line in lines:
-            line = line.strip()
-            if "ALTERNATIVE WORDING" in line.upper():
-                current_category = "alternative_wording"
-            elif "COMPROMISE" in line.upper():
-                current_category = "compromise_positions"
-            elif "QUESTIONS" in line.upper():
-                current_category = "questions_to_ask"
-            elif "FALLBACK" in line.upper():
-                current_category = "fallback_options"
-            elif "DEAL BREAKER" in line.upper():
-                current_category = "deal_breakers"
-            elif line and not line.startswith(('1.', '2.', '3.', '4.', '5.')):
-                suggestion_categories[current_category].append(line)
+        for category, lines in _split_sections((suggestions,), NEGOTIATION_SECTION_PATTERN, "alternative_wording"):
+            suggestion_categories[category].extend(lines)
         
         return suggestion_categories
 
@@ -2,9 +2,10 @@
 NLP Pipeline for Legal Contract Processing
 Handles contract parsing, entity extraction, and clause analysis
 """
+import importlib.util
 import re
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 import logging
 
@@ -12,14 +13,74 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Try to import spaCy, but don't fail if it's not available
-try:
-    import spacy
-    SPACY_AVAILABLE = True
-except ImportError:
-    SPACY_AVAILABLE = False
+# Check for spaCy without importing it; the import itself is deferred to
+# LegalNLPPipeline.__init__ since it is slow
+SPACY_AVAILABLE = importlib.util.find_spec("spacy") is not None
+if not SPACY_AVAILABLE:
     logger.warning("spaCy not available. Using basic NLP processing.")
 
+# Clause boundaries: numbered clauses, lettered sub-clauses, section headers,
+# WHEREAS and NOW THEREFORE recitals. The shared newline-and-indent anchor is
+# factored out of the alternation, so the engine can skip straight from one
+# newline to the next and only tries the alternatives there
+CLAUSE_SEPARATOR_PATTERN = re.compile(
+    r'\n\s*(?:'
+    r'\d+\.'
+    r'|\([a-z]\)'
+    r'|[A-Z][A-Z\s]+:'
+    r'|WHEREAS'
+    r'|NOW THEREFORE'
+    r')',
+    re.IGNORECASE
+)
+
+def _modal_patterns(*triggers: str) -> List[Tuple[str, re.Pattern]]:
+    """Pair each trigger phrase with a pattern capturing what follows it up to the end of the sentence"""
+    return [(trigger, re.compile(re.escape(trigger) + r"\s+([^.]+)", re.IGNORECASE)) for trigger in triggers]
+
+# Obligation, rights and prohibition phrasing. Case-insensitive patterns miss
+# the regex engine's literal-prefix search, so each keeps its trigger phrase
+# for a cheap substring test that lets clauses without it skip the scan
+OBLIGATION_PATTERNS = _modal_patterns("shall", "must", "required to", "obligated to")
+RIGHTS_PATTERNS = _modal_patterns("entitled to", "has the right to", "may", "permitted to")
+PROHIBITION_PATTERNS = _modal_patterns("shall not", "must not", "prohibited from", "cannot")
+
+# Vague terms that leave obligations open to interpretation
+AMBIGUITY_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r"reasonable\s+\w+", r"appropriate\s+\w+", r"satisfactory\s+\w+",
+    r"as soon as possible", r"in due course", r"from time to time",
+    r"best efforts", r"commercially reasonable", r"material\s+\w+",
+    r"substantial\s+\w+", r"significant\s+\w+"
+)]
+
+# Hindi contract terms and their English equivalents, replaced in one pass
+HINDI_TO_ENGLISH = {
+    "करार": "agreement",
+    "अनुबंध": "contract",
+    "पार्टी": "party",
+    "कंपनी": "company",
+    "कर्मचारी": "employee"
+}
+HINDI_TERM_PATTERN = re.compile("|".join(map(re.escape, HINDI_TO_ENGLISH)))
+
+# Characters that make a pattern-table entry a regex rather than a plain keyword
+REGEX_METACHARACTERS = frozenset(r".^$*+?{}[]\|()")
+
+def _split_keyword_table(table: Dict[str, List[str]]) -> Dict[str, Tuple[Tuple[str, ...], List[re.Pattern]]]:
+    """Split each label's patterns into plain keywords and compiled regexes
+    
+    Most entries are plain lowercase phrases; str.count finds their
+    non-overlapping occurrences, as findall would, with a fast substring search
+    instead of a trip through the regex engine.
+    """
+    return {
+        label: (
+            tuple(pattern for pattern in patterns if REGEX_METACHARACTERS.isdisjoint(pattern)),
+            [re.compile(pattern) for pattern in patterns if not REGEX_METACHARACTERS.isdisjoint(pattern)]
+        )
+        for label, patterns in table.items()
+    }
+
 @dataclass
 class ContractEntity:
     """Represents an extracted entity from contract"""
@@ -39,6 +100,13 @@ class ContractClause:
     obligations: List[str]
     rights: List[str]
     prohibitions: List[str]
+    word_count: int = field(init=False)
+    char_count: int = field(init=False)
+
+    def __post_init__(self):
+        """Count words and characters once so the UI doesn't redo it every rerun"""
+        self.word_count = len(self.text.split())
+        self.char_count = len(self.text)
 
 class LegalNLPPipeline:
     """Main NLP pipeline for contract analysis"""
@@ -49,9 +117,10 @@ class LegalNLPPipeline:
         if SPACY_AVAILABLE:
             try:
                 # Try to load spaCy model
+                import spacy
                 self.nlp = spacy.load("en_core_web_sm")
                 logger.info("SpaCy model loaded successfully")
-            except OSError:
+            except (ImportError, OSError):
                 logger.warning("SpaCy model not found. Using basic NLP processing.")
         else:
             logger.info("SpaCy not available. Using basic NLP processing.")
@@ -144,35 +213,37 @@ class LegalNLPPipeline:
                 r"solicit.*employee", r"solicit.*client"
             ]
         }
+        
+        # Compile the pattern tables once; the analysis methods run them on every
+        # document and clause. Contract and clause patterns are matched against
+        # lowercased text, so they need no IGNORECASE.
+        self._contract_keywords = _split_keyword_table(self.contract_patterns)
+        self._entity_regexes = {
+            entity_type: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+            for entity_type, patterns in self.entity_patterns.items()
+        }
+        self._clause_keywords = _split_keyword_table(self.clause_patterns)
 
     def normalize_hindi_text(self, text: str) -> str:
         """Convert Hindi text to English for processing"""
         # Basic transliteration - in production, use proper Hindi NLP
         # This is a placeholder for Hindi processing
-        hindi_to_english = {
-            "करार": "agreement",
-            "अनुबंध": "contract", 
-            "पार्टी": "party",
-            "कंपनी": "company",
-            "कर्मचारी": "employee"
+        if text.isascii():
+            return text
+        return HINDI_TERM_PATTERN.sub(lambda match: HINDI_TO_ENGLISH[match.group()], text)
+
+    @staticmethod
+    def _keyword_scores(text_lower: str, keyword_table: Dict) -> Dict[str, int]:
+        """Count each label's keyword and pattern matches in lowercased text"""
+        return {
+            label: sum(map(text_lower.count, keywords)) + sum(len(pattern.findall(text_lower)) for pattern in patterns)
+            for label, (keywords, patterns) in keyword_table.items()
         }
-        
-        for hindi, english in hindi_to_english.items():
-            text = text.replace(hindi, english)
-        
-        return text
 
     def classify_contract_type(self, text: str) -> Tuple[str, float]:
         """Classify the type of contract"""
         text_lower = text.lower()
-        scores = {}
-        
-        for contract_type, patterns in self.contract_patterns.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(re.findall(pattern, text_lower, re.IGNORECASE))
-                score += matches
-            scores[contract_type] = score
+        scores = self._keyword_scores(text_lower, self._contract_keywords)
         
         if not scores or max(scores.values()) == 0:
             return "Unknown", 0.0
@@ -203,9 +274,9 @@ class LegalNLPPipeline:
             logger.info("Using basic pattern matching for entity extraction")
         
         # Custom pattern matching for legal entities (always run)
-        for entity_type, patterns in self.entity_patterns.items():
+        for entity_type, patterns in self._entity_regexes.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, text, re.IGNORECASE)
+                matches = pattern.finditer(text)
                 for match in matches:
                     entities.append(ContractEntity(
                         text=match.group(),
@@ -219,40 +290,15 @@ class LegalNLPPipeline:
 
     def segment_clauses(self, text: str) -> List[str]:
         """Segment contract into individual clauses"""
-        # Split by common clause indicators
-        clause_separators = [
-            r'\n\s*\d+\.',  # Numbered clauses
-            r'\n\s*\([a-z]\)',  # Lettered sub-clauses
-            r'\n\s*[A-Z][A-Z\s]+:',  # Section headers
-            r'\n\s*WHEREAS',  # Whereas clauses
-            r'\n\s*NOW THEREFORE',  # Therefore clauses
-        ]
-        
-        # Combine all separators
-        separator_pattern = '|'.join(clause_separators)
-        clauses = re.split(separator_pattern, text, flags=re.IGNORECASE)
-        
-        # Clean and filter clauses
-        cleaned_clauses = []
-        for clause in clauses:
-            clause = clause.strip()
-            if len(clause) > 50:  # Filter out very short segments
-                cleaned_clauses.append(clause)
-        
-        return cleaned_clauses
+        # Split by common clause indicators, then drop very short segments
+        segments = (clause.strip() for clause in CLAUSE_SEPARATOR_PATTERN.split(text))
+        return [clause for clause in segments if len(clause) > 50]
 
     def classify_clause_type(self, clause_text: str) -> str:
         """Classify the type of a contract clause"""
         clause_lower = clause_text.lower()
-        scores = {}
-        
-        for clause_type, patterns in self.clause_patterns.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(re.findall(pattern, clause_lower))
-                score += matches
-            if score > 0:
-                scores[clause_type] = score
+        scores = self._keyword_scores(clause_lower, self._clause_keywords)
+        scores = {clause_type: score for clause_type, score in scores.items() if score > 0}
         
         if not scores:
             return "GENERAL"
@@ -261,60 +307,21 @@ class LegalNLPPipeline:
 
     def extract_obligations_rights_prohibitions(self, clause_text: str) -> Tuple[List[str], List[str], List[str]]:
         """Extract obligations, rights, and prohibitions from clause"""
-        obligations = []
-        rights = []
-        prohibitions = []
-        
-        # Obligation patterns
-        obligation_patterns = [
-            r"shall\s+([^.]+)",
-            r"must\s+([^.]+)",
-            r"required to\s+([^.]+)",
-            r"obligated to\s+([^.]+)"
-        ]
-        
-        # Rights patterns  
-        rights_patterns = [
-            r"entitled to\s+([^.]+)",
-            r"has the right to\s+([^.]+)",
-            r"may\s+([^.]+)",
-            r"permitted to\s+([^.]+)"
-        ]
-        
-        # Prohibition patterns
-        prohibition_patterns = [
-            r"shall not\s+([^.]+)",
-            r"must not\s+([^.]+)",
-            r"prohibited from\s+([^.]+)",
-            r"cannot\s+([^.]+)"
-        ]
-        
-        for pattern in obligation_patterns:
-            matches = re.findall(pattern, clause_text, re.IGNORECASE)
-            obligations.extend([match.strip() for match in matches])
-        
-        for pattern in rights_patterns:
-            matches = re.findall(pattern, clause_text, re.IGNORECASE)
-            rights.extend([match.strip() for match in matches])
-            
-        for pattern in prohibition_patterns:
-            matches = re.findall(pattern, clause_text, re.IGNORECASE)
-            prohibitions.extend([match.strip() for match in matches])
+        clause_lower = clause_text.lower()
+        obligations, rights, prohibitions = (
+            [match.strip()
+             for trigger, pattern in patterns if trigger in clause_lower
+             for match in pattern.findall(clause_text)]
+            for patterns in (OBLIGATION_PATTERNS, RIGHTS_PATTERNS, PROHIBITION_PATTERNS)
+        )
         
         return obligations, rights, prohibitions
 
     def detect_ambiguity(self, text: str) -> List[str]:
         """Detect potentially ambiguous language in contract"""
-        ambiguous_phrases = [
-            r"reasonable\s+\w+", r"appropriate\s+\w+", r"satisfactory\s+\w+",
-            r"as soon as possible", r"in due course", r"from time to time",
-            r"best efforts", r"commercially reasonable", r"material\s+\w+",
-            r"substantial\s+\w+", r"significant\s+\w+"
-        ]
-        
         ambiguities = []
-        for pattern in ambiguous_phrases:
-            matches = re.findall(pattern, text, re.IGNORECASE)
+        for pattern in AMBIGUITY_PATTERNS:
+            matches = pattern.findall(text)
             ambiguities.extend(matches)
         
         return list(set(ambiguities))  # Remove duplicates
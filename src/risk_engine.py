@@ -7,6 +7,7 @@ from typing import Dict, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
+from config import classify_risk
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,13 @@ class RiskLevel(Enum):
     MEDIUM = "MEDIUM" 
     HIGH = "HIGH"
 
+# Weight of each risk level in the overall contract score
+RISK_LEVEL_WEIGHTS = {
+    RiskLevel.HIGH: 3,
+    RiskLevel.MEDIUM: 2,
+    RiskLevel.LOW: 1
+}
+
 @dataclass
 class RiskFlag:
     """Represents a detected risk in contract"""
@@ -219,6 +227,23 @@ class ContractRiskEngine:
                 "description": "Force majeure protection"
             }
         }
+        
+        # Each risk type's patterns fused into one alternation, so a clause is
+        # scanned once per risk type instead of once per pattern
+        self.risk_matchers = {
+            risk_type: re.compile(
+                "|".join(f"(?:{pattern})" for pattern in risk_config["patterns"]),
+                re.IGNORECASE
+            )
+            for risk_type, risk_config in self.risk_patterns.items()
+        }
+        
+        # Favorable patterns stay separate: every match reduces the score
+        self.favorable_matchers = [
+            (re.compile(pattern, re.IGNORECASE), favorable_config["score_reduction"])
+            for favorable_config in self.favorable_patterns.values()
+            for pattern in favorable_config["patterns"]
+        ]
 
     def analyze_clause_risk(self, clause_text: str, clause_type: str) -> List[RiskFlag]:
         """Analyze a single clause for risks"""
@@ -227,36 +252,30 @@ class ContractRiskEngine:
         
         # Check for high-risk patterns
         for risk_type, risk_config in self.risk_patterns.items():
-            for pattern in risk_config["patterns"]:
-                if re.search(pattern, clause_lower, re.IGNORECASE):
-                    # Calculate risk score
-                    base_score = risk_config["base_score"]
-                    
-                    # Adjust score based on clause context
-                    adjusted_score = self._adjust_risk_score(
-                        base_score, clause_text, clause_type, risk_type
-                    )
-                    
-                    # Determine risk level
-                    if adjusted_score >= 71:
-                        risk_level = RiskLevel.HIGH
-                    elif adjusted_score >= 31:
-                        risk_level = RiskLevel.MEDIUM
-                    else:
-                        risk_level = RiskLevel.LOW
-                    
-                    risk = RiskFlag(
-                        clause_text=clause_text[:200] + "..." if len(clause_text) > 200 else clause_text,
-                        risk_type=risk_type,
-                        risk_level=risk_level,
-                        description=risk_config["description"],
-                        business_impact=risk_config["business_impact"],
-                        who_it_favors=risk_config["who_it_favors"],
-                        sme_concern=risk_config["sme_concern"],
-                        score=adjusted_score
-                    )
-                    risks.append(risk)
-                    break  # Only flag once per risk type per clause
+            # Only flag once per risk type per clause
+            if self.risk_matchers[risk_type].search(clause_lower):
+                # Calculate risk score
+                base_score = risk_config["base_score"]
+                
+                # Adjust score based on clause context
+                adjusted_score = self._adjust_risk_score(
+                    base_score, clause_text, clause_type, risk_type
+                )
+                
+                # Determine risk level
+                risk_level = RiskLevel(classify_risk(adjusted_score))
+                
+                risk = RiskFlag(
+                    clause_text=clause_text[:200] + "..." if len(clause_text) > 200 else clause_text,
+                    risk_type=risk_type,
+                    risk_level=risk_level,
+                    description=risk_config["description"],
+                    business_impact=risk_config["business_impact"],
+                    who_it_favors=risk_config["who_it_favors"],
+                    sme_concern=risk_config["sme_concern"],
+                    score=adjusted_score
+                )
+                risks.append(risk)
         
         return risks
 
@@ -266,10 +285,9 @@ class ContractRiskEngine:
         clause_lower = clause_text.lower()
         
         # Check for mitigating factors
-        for favorable_type, favorable_config in self.favorable_patterns.items():
-            for pattern in favorable_config["patterns"]:
-                if re.search(pattern, clause_lower, re.IGNORECASE):
-                    adjusted_score -= favorable_config["score_reduction"]
+        for matcher, score_reduction in self.favorable_matchers:
+            if matcher.search(clause_lower):
+                adjusted_score -= score_reduction
         
         # Context-specific adjustments
         if risk_type == "PENALTY_LIQUIDATED_DAMAGES":
@@ -314,26 +332,14 @@ class ContractRiskEngine:
         if not all_risks:
             return 20, "LOW"  # Base low risk for contracts with no major issues
         
-        # Weight risks by severity
-        high_risks = [r for r in all_risks if r.risk_level == RiskLevel.HIGH]
-        medium_risks = [r for r in all_risks if r.risk_level == RiskLevel.MEDIUM]
-        low_risks = [r for r in all_risks if r.risk_level == RiskLevel.LOW]
-        
-        # Calculate weighted score
+        # Calculate weighted score in a single pass, weighting risks by severity
         total_score = 0
         total_weight = 0
         
-        for risk in high_risks:
-            total_score += risk.score * 3  # High risks weighted 3x
-            total_weight += 3
-        
-        for risk in medium_risks:
-            total_score += risk.score * 2  # Medium risks weighted 2x
-            total_weight += 2
-        
-        for risk in low_risks:
-            total_score += risk.score * 1  # Low risks weighted 1x
-            total_weight += 1
+        for risk in all_risks:
+            weight = RISK_LEVEL_WEIGHTS[risk.risk_level]
+            total_score += risk.score * weight
+            total_weight += weight
         
         if total_weight == 0:
             overall_score = 20
@@ -341,14 +347,7 @@ class ContractRiskEngine:
             overall_score = min(100, total_score // total_weight)
         
         # Determine overall risk level
-        if overall_score >= 71:
-            risk_level = "HIGH"
-        elif overall_score >= 31:
-            risk_level = "MEDIUM"
-        else:
-            risk_level = "LOW"
-        
-        return overall_score, risk_level
+        return overall_score, classify_risk(overall_score)
 
     def analyze_contract_risks(self, clauses: List) -> Dict:
         """Analyze all contract clauses for risks"""
@@ -367,12 +366,10 @@ class ContractRiskEngine:
         # Calculate overall risk score
         overall_score, overall_level = self.calculate_contract_risk_score(all_risks)
         
-        # Categorize risks by type
-        risk_summary = {
-            "HIGH": [r for r in all_risks if r.risk_level == RiskLevel.HIGH],
-            "MEDIUM": [r for r in all_risks if r.risk_level == RiskLevel.MEDIUM],
-            "LOW": [r for r in all_risks if r.risk_level == RiskLevel.LOW]
-        }
+        # Categorize risks by level in one pass
+        risk_summary = {"HIGH": [], "MEDIUM": [], "LOW": []}
+        for risk in all_risks:
+            risk_summary[risk.risk_level.value].append(risk)
         
         result = {
             "overall_score": overall_score,